@@ -6,9 +6,23 @@ A powerful overlay application with real-time microphone transcription and Claud
 __version__ = "0.1.0"
 __author__ = "Chris Watkins"
 
-from .main import main
-from .ui import OverlayWidget
-from .audio import FastAudioListener, AudioListener
-from .claude_client import ClaudeClient
+__all__ = ["main", "OverlayWidget", "FastAudioListener", "AudioListener", "ClaudeClient"]
 
-__all__ = ["main", "OverlayWidget", "FastAudioListener", "AudioListener", "ClaudeClient"]
\ No newline at end of file
+# Exports are resolved on first access so importing the package (e.g. for
+# the CLI) doesn't pull in PyQt6, Whisper or anthropic up front
+_LAZY_EXPORTS = {
+    "main": ".main",
+    "OverlayWidget": ".ui",
+    "FastAudioListener": ".audio",
+    "AudioListener": ".audio",
+    "ClaudeClient": ".claude_client",
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,6 +2,7 @@
 Audio processing and speech recognition for SAI
 """
 
+import os
 import queue
 import time
 import speech_recognition as sr
@@ -10,19 +11,37 @@ import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal, QThreadPool, QRunnable
 
 try:
+    import torch
     import whisper
     import webrtcvad
     FAST_AUDIO_AVAILABLE = True
+    # Use half the cores for inference - over-subscription slows Whisper down
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
 except ImportError:
     FAST_AUDIO_AVAILABLE = False
     print("Fast audio dependencies not available, using fallback mode")
 
+def quantize_whisper_linears(model):
+    """Dynamically quantize a CPU Whisper model's Linear layers to INT8 in place
+    
+    Whisper builds its layers from whisper.model.Linear, an nn.Linear subclass that only
+    casts the weight to the input dtype (for fp16). quantize_dynamic matches and converts
+    modules by exact type, so those layers are retyped to nn.Linear first; in FP32 CPU
+    inference the two behave identically. Returns the number of layers replaced.
+    """
+    for module in model.modules():
+        if type(module) is whisper.model.Linear:
+            module.__class__ = torch.nn.Linear
+    torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return sum(isinstance(module, torch.ao.nn.quantized.dynamic.Linear) for module in model.modules())
+
 class FastAudioListener(QThread):
     """Optimized audio listener with local Whisper and VAD"""
     
     transcription_ready = pyqtSignal(str)
     whisper_status_changed = pyqtSignal(str)
     claude_ready = pyqtSignal(str)  # Separate signal for Claude processing
+    results_available = pyqtSignal()  # Emitted from worker threads; delivered on the main thread
     
     def __init__(self, device_index=None):
         super().__init__()
@@ -36,7 +55,20 @@ class FastAudioListener(QThread):
         print("Loading Whisper model...")
         try:
             self.whisper_model = whisper.load_model("tiny")
-            print("Whisper tiny model loaded successfully")
+            print(f"Whisper tiny model loaded successfully on {self.whisper_model.device}")
+            
+            # INT8 dynamic quantization of the Linear layers (CPU inference only;
+            # GPU models are left as loaded)
+            if self.whisper_model.device.type == "cpu":
+                try:
+                    replaced = quantize_whisper_linears(self.whisper_model)
+                    if replaced:
+                        print(f"Whisper model quantized to INT8 ({replaced} Linear layers)")
+                    else:
+                        print("Whisper quantization replaced no layers, using FP32")
+                except Exception as e:
+                    print(f"Whisper quantization unavailable, using FP32: {e}")
+            self.whisper_model.eval()
         except Exception as e:
             print(f"Failed to load Whisper: {e}, falling back to Google")
             self.whisper_model = None
@@ -58,11 +90,15 @@ class FastAudioListener(QThread):
         self._transcription_ready = False
         self._partial_transcription = ""
         self._partial_ready = False
+        self._is_final = False  # Whether the pending result ends an utterance
         
         # Accumulate all transcribed text for complete Claude requests
         self._accumulated_text = ""
         self._text_segments = []
         
+        # This object lives in the main thread, so the connection is queued there
+        self.results_available.connect(self.check_transcription_results)
+        
     def update_microphone(self, device_index):
         """Update the microphone device"""
         self.device_index = device_index
@@ -209,8 +245,9 @@ class FastAudioListener(QThread):
             # Final dtype check
             audio = audio.astype(np.float32)
             
-            # Transcribe with Whisper
-            result = self.whisper_model.transcribe(audio, fp16=False, language='en')
+            # Transcribe with Whisper (no autograd bookkeeping)
+            with torch.inference_mode():
+                result = self.whisper_model.transcribe(audio, fp16=False, language='en')
             return result.get('text', '').strip()
             
         except Exception as e:
@@ -306,6 +343,7 @@ class FastAudioListener(QThread):
                         # Show partial transcription INSTANTLY while processing
                         self._partial_transcription = f"[Processing {len(self.speech_frames)} frames of speech...]"
                         self._partial_ready = True
+                        self.results_available.emit()
                         
                         # Transcribe in separate thread to avoid blocking
                         is_final = self.silence_count >= self.max_silence
@@ -346,18 +384,23 @@ class FastAudioListener(QThread):
                 self._transcription_result = text
                 self._transcription_ready = True
                 self._is_final = is_final  # Track if this should be sent to Claude
+                self.results_available.emit()
             except Exception as e:
                 print(f"Transcription worker error: {e}")
                 self._transcription_result = None
                 self._transcription_ready = True
                 self._is_final = is_final
+                self.results_available.emit()
         
         # Run in Python thread instead of Qt thread pool
         thread = threading.Thread(target=transcribe_worker, daemon=True)
         thread.start()
     
     def check_transcription_results(self):
-        """Check for transcription results from worker thread (call from main thread)"""
+        """Check for transcription results from worker thread (runs on results_available)"""
+        if not self.running:
+            return  # Stopped listeners no longer report results
+        
         # Check for partial transcriptions (instant display)
         if self._partial_ready:
             self._partial_ready = False
@@ -388,8 +431,8 @@ class FastAudioListener(QThread):
                     print(f"Accumulated text: '{self._accumulated_text}'")
                 
                 # If this is final (pause detected), send ALL accumulated text to Claude
-                if getattr(self, '_is_final', False):
-                    if self._accumulated_text and hasattr(self, 'claude_ready'):
+                if self._is_final:
+                    if self._accumulated_text:
                         # Filter: Only send to Claude if we have multiple words (at least 2)
                         word_count = len(self._accumulated_text.split())
                         if word_count >= 2:
@@ -422,7 +465,11 @@ class FastAudioListener(QThread):
             print(f"Error querying devices: {e}")
             return None
         
-        # Test each device to find one that works
+        # Prefer native 16kHz (no resampling), then 48kHz (VAD-native), then the rest
+        rate_rank = {16000: 0, 48000: 1}
+        input_devices.sort(key=lambda d: rate_rank.get(int(d[1]['default_samplerate']), 2))
+        
+        # Validate each device's settings without opening a stream
         for device_id, device_info in input_devices:
             try:
                 print(f"Testing device {device_id}: {device_info['name']}")
@@ -430,18 +477,14 @@ class FastAudioListener(QThread):
                 print(f"Testing device {device_id}")
             
             try:
-                # Test record for 0.1 seconds
-                test_duration = 0.1
                 sample_rate = int(device_info['default_samplerate'])
                 
-                test_data = sd.rec(
-                    int(test_duration * sample_rate),
-                    samplerate=sample_rate,
-                    channels=1,
+                sd.check_input_settings(
                     device=device_id,
-                    dtype=np.float32
+                    channels=1,
+                    samplerate=sample_rate,
+                    dtype='float32'
                 )
-                sd.wait()
                 
                 print(f"✓ Device {device_id} works (rate: {sample_rate})")
                 return device_id
@@ -3,121 +3,201 @@ Claude API client for SAI
 """
 
 import anthropic
+import asyncio
+import hashlib
 import threading
-from PyQt6.QtCore import QRunnable, QThreadPool
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 
-class AsyncClaudeWorker(QRunnable):
-    """Worker for async Claude API calls"""
-    
-    def __init__(self, client, text, context, custom_prompt, mode, callback):
-        super().__init__()
-        self.client = client
-        self.text = text
-        self.context = context
-        self.custom_prompt = custom_prompt
-        self.mode = mode
-        self.callback = callback
-    
-    def run(self):
-        """Execute the API call in background"""
-        try:
-            response = self.client.get_response_sync(
-                self.text, self.context, self.custom_prompt, self.mode
-            )
-            self.callback(response)
-        except Exception as e:
-            self.callback(f"Error: {str(e)}")
+from .config import Config
+
+try:
+    import diskcache
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DISK_CACHE_AVAILABLE = False
+
+TEMPLATE_MODES = ("default", "meeting", "learning", "summary")
+
+@lru_cache(maxsize=8)
+def _build_templates(template_strings: tuple) -> dict:
+    """Map mode names to template strings (memoized per distinct template set)"""
+    return dict(zip(TEMPLATE_MODES, template_strings))
 
 class ClaudeClient:
     """Optimized Claude API client with caching and async calls"""
     
     def __init__(self, api_key: str):
-        self.client = anthropic.Anthropic(api_key=api_key)
-        self.response_cache = {}  # Simple LRU cache
+        # Pooled keep-alive connections avoid a TCP + TLS handshake per request
+        self.aclient = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            # The SDK's own client class, so it matches whichever HTTP package the SDK uses
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                limits=type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+                    max_connections=anthropic.DEFAULT_CONNECTION_LIMITS.max_connections,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=300
+                ),
+                timeout=30.0
+            )
+        )
+        self.response_cache = OrderedDict()  # LRU cache (most recent at the end)
         self.max_cache_size = 100
-        self.thread_pool = QThreadPool.globalInstance()
-        self.thread_pool.setMaxThreadCount(3)  # Limit concurrent API calls
+        self._lock = threading.Lock()  # Guards response_cache and _pending across threads
+        self._pending = {}  # cache_key -> on_done callbacks waiting on an in-flight request
+        
+        # Persistent L2 cache so repeated prompts survive restarts
+        self.disk_cache = None
+        if DISK_CACHE_AVAILABLE:
+            try:
+                self.disk_cache = diskcache.Cache(
+                    str(Path.home() / '.sai' / 'cache'),
+                    size_limit=50_000_000,
+                    eviction_policy='least-recently-used'
+                )
+            except Exception as e:
+                print(f"Disk cache unavailable: {e}")
+        
+        # Single background event loop multiplexes all in-flight API calls
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
     
-    def _get_cache_key(self, text: str, context: str, mode: str) -> str:
-        """Generate cache key for request"""
-        return f"{mode}:{hash(text + context)}"
+    def _get_cache_key(self, prompt: str) -> str:
+        """Generate cache key for the formatted prompt (stable across processes)
+        
+        Keying on the final prompt means edits to a mode template or the
+        custom prompt never return a response cached for the old wording.
+        """
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
     
-    def get_response_sync(self, text: str, context: str = "", custom_prompt: str = "", mode: str = "default", settings: dict = None) -> str:
-        """Synchronous API call (for worker threads)"""
+    def _get_templates(self, settings: dict = None) -> dict:
+        """Get mode templates from settings, falling back to the defaults"""
+        source = settings or Config.DEFAULT_SETTINGS
+        return _build_templates(tuple(
+            source.get(f'template_{mode}', Config.DEFAULT_SETTINGS[f'template_{mode}'])
+            for mode in TEMPLATE_MODES
+        ))
+    
+    def _build_prompt(self, text: str, context: str, custom_prompt: str, mode: str, settings: dict = None) -> str:
+        """Format only the prompt for the requested mode"""
+        if mode == "custom":
+            return custom_prompt.format(text=text, context=context) if custom_prompt else f"Respond to: {text}"
+        
+        templates = self._get_templates(settings)
+        template = templates.get(mode, templates["default"])
+        return template.format(text=text, context=context)
+    
+    def _get_cached(self, cache_key: str):
+        """Look up a response in the in-memory LRU cache (None on miss)"""
+        with self._lock:
+            response = self.response_cache.get(cache_key)
+            if response is not None:
+                self.response_cache.move_to_end(cache_key)
+            return response
+    
+    def _cache_response(self, cache_key: str, response: str):
+        """Store response in the in-memory LRU cache"""
+        with self._lock:
+            if cache_key not in self.response_cache and len(self.response_cache) >= self.max_cache_size:
+                # Evict least recently used entry
+                self.response_cache.popitem(last=False)
+            
+            self.response_cache[cache_key] = response
+    
+    async def _get_response(self, text: str, context: str, custom_prompt: str, mode: str, settings: dict = None, on_chunk=None) -> str:
+        """API call coroutine (runs on the client's event loop)"""
         try:
             # Check cache first
-            cache_key = self._get_cache_key(text, context, mode)
-            if cache_key in self.response_cache:
-                return self.response_cache[cache_key]
+            prompt = self._build_prompt(text, context, custom_prompt, mode, settings)
+            cache_key = self._get_cache_key(prompt)
+            response = self._get_cached(cache_key)
+            if response is not None:
+                return response
             
-            # Get templates from settings or use defaults
-            if settings:
-                templates = {
-                    "default": settings.get('template_default', 'Context: {context}\nInput: "{text}"\nBrief response (max 30 words):'),
-                    "meeting": settings.get('template_meeting', 'Meeting context: {context}\nCurrent: "{text}"\nKey point (max 20 words):'),
-                    "learning": settings.get('template_learning', 'Context: {context}\nTopic: "{text}"\nQuick insight (max 25 words):'),
-                    "summary": settings.get('template_summary', 'Context: {context}\nText: "{text}"\nSummary (max 25 words):'),
-                }
-            else:
-                # Fallback templates
-                templates = {
-                    "default": 'Context: {context}\nInput: "{text}"\nBrief response (max 30 words):',
-                    "meeting": 'Meeting context: {context}\nCurrent: "{text}"\nKey point (max 20 words):',
-                    "learning": 'Context: {context}\nTopic: "{text}"\nQuick insight (max 25 words):',
-                    "summary": 'Context: {context}\nText: "{text}"\nSummary (max 25 words):',
-                }
+            # Fall back to the disk cache and promote hits to memory
+            if self.disk_cache is not None:
+                response = self.disk_cache.get(cache_key)
+                if response is not None:
+                    self._cache_response(cache_key, response)
+                    return response
             
-            # Format the prompts with actual values
-            prompts = {}
-            for mode_name, template in templates.items():
-                prompts[mode_name] = template.format(text=text, context=context)
-            
-            # Handle custom mode
-            prompts["custom"] = custom_prompt.format(text=text, context=context) if custom_prompt else f"Respond to: {text}"
-            
-            prompt = prompts.get(mode, prompts["default"])
-
-            message = self.client.messages.create(
+            # Stream so partial text can be shown as soon as the first token arrives
+            async with self.aclient.messages.stream(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=100,  # Reduced for faster response
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3  # Lower temperature for consistency
-            )
+            ) as stream:
+                async for chunk in stream.text_stream:
+                    if on_chunk:
+                        on_chunk(chunk)
+                message = await stream.get_final_message()
             
             response = message.content[0].text if message.content else "No response"
             
             # Cache the response
-            if len(self.response_cache) >= self.max_cache_size:
-                # Remove oldest entry
-                oldest_key = next(iter(self.response_cache))
-                del self.response_cache[oldest_key]
-            
-            self.response_cache[cache_key] = response
+            self._cache_response(cache_key, response)
+            if self.disk_cache is not None:
+                self.disk_cache.set(cache_key, response)
             return response
             
         except Exception as e:
             return f"API Error: {str(e)}"
     
+    def get_response_sync(self, text: str, context: str = "", custom_prompt: str = "", mode: str = "default", settings: dict = None) -> str:
+        """Synchronous API call (blocks until the event loop finishes the request)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self._get_response(text, context, custom_prompt, mode, settings), self._loop
+        )
+        return future.result()
+    
     def get_response_async(self, text: str, context: str = "", custom_prompt: str = "", mode: str = "default", callback=None, settings: dict = None):
-        """Async API call using Python threading instead of Qt threading"""
+        """Async API call scheduled on the background event loop"""
         if not callback:
             return self.get_response_sync(text, context, custom_prompt, mode)
         
+        self.get_response_streaming(text, context, custom_prompt, mode, on_done=callback, settings=settings)
+    
+    def get_response_streaming(self, text: str, context: str = "", custom_prompt: str = "", mode: str = "default", on_chunk=None, on_done=None, settings: dict = None):
+        """Stream response text to on_chunk as it arrives, then call on_done with the full response"""
         # Check cache first (synchronously)
-        cache_key = self._get_cache_key(text, context, mode)
-        if cache_key in self.response_cache:
-            callback(self.response_cache[cache_key])
+        try:
+            cache_key = self._get_cache_key(self._build_prompt(text, context, custom_prompt, mode, settings))
+        except Exception as e:
+            # A malformed custom prompt or template cannot be formatted
+            if on_done:
+                on_done(f"Error: {str(e)}")
             return
+        response = self._get_cached(cache_key)
+        if response is not None:
+            if on_done:
+                on_done(response)
+            return
+        
+        # Identical request already in flight: wait for its result instead of paying twice
+        with self._lock:
+            waiters = self._pending.get(cache_key)
+            if waiters is not None:
+                waiters.append(on_done)
+                return
+            waiters = self._pending[cache_key] = [on_done]
         
-        # Use Python threading to avoid Qt threading issues
-        def api_worker():
+        def on_future_done(future):
+            with self._lock:
+                self._pending.pop(cache_key, None)
             try:
-                response = self.get_response_sync(text, context, custom_prompt, mode, settings)
-                callback(response)
+                response = future.result()
             except Exception as e:
-                callback(f"Error: {str(e)}")
+                response = f"Error: {str(e)}"
+            for waiter in waiters:
+                if waiter:
+                    waiter(response)
         
-        thread = threading.Thread(target=api_worker, daemon=True)
-        thread.start()
\ No newline at end of file
+        future = asyncio.run_coroutine_threadsafe(
+            self._get_response(text, context, custom_prompt, mode, settings, on_chunk), self._loop
+        )
+        future.add_done_callback(on_future_done)
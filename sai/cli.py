@@ -5,8 +5,6 @@ Command Line Interface for SAI
 import argparse
 import sys
 from pathlib import Path
-from .main import main as run_overlay
-from .config import Config
 
 def check_requirements():
     """Check if all requirements are met"""
@@ -20,6 +18,7 @@ def check_requirements():
         print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
     
     # Check API key
+    from .config import Config
     try:
         Config.get_api_key()
         print("✅ ANTHROPIC_API_KEY found")
@@ -118,6 +117,8 @@ For more information, visit: https://github.com/watkinslabs/sai
             sys.exit(1)
         
         print("Starting SAI overlay...")
+        # Deferred so 'check'/'setup' don't pay for PyQt6/anthropic imports
+        from .main import main as run_overlay
         return run_overlay()
     
 if __name__ == "__main__":
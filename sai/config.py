@@ -3,16 +3,34 @@ Configuration and settings management for SAI
 """
 
 import os
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from . import storage
+
+# Load environment variables (once per process tree)
+if not os.environ.get('_SAI_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_SAI_DOTENV_LOADED'] = '1'
+
+@lru_cache(maxsize=1)
+def _get_api_key_cached() -> str:
+    """Read the API key from the environment once (errors are not cached)"""
+    api_key = os.getenv('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    return api_key
 
 class Config:
     """Configuration class for SAI settings"""
     
-    DEFAULT_SETTINGS = {
+    # Read-only so shared readers can't mutate the defaults; copy with get_default_settings()
+    DEFAULT_SETTINGS = MappingProxyType({
         'font_size': 12,
         'opacity': 0.9,
         'mode': 'default',
@@ -30,28 +48,29 @@ class Config:
         'template_meeting': 'Meeting context: {context}\nCurrent: "{text}"\nKey point (max 20 words):',
         'template_learning': 'Context: {context}\nTopic: "{text}"\nQuick insight (max 25 words):',
         'template_summary': 'Context: {context}\nText: "{text}"\nSummary (max 25 words):',
-    }
+    })
     
     @staticmethod
     def get_api_key() -> str:
         """Get Claude API key from environment"""
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-        return api_key
+        return _get_api_key_cached()
     
     @staticmethod
     def get_default_settings() -> Dict[str, Any]:
-        """Get default application settings"""
-        return Config.DEFAULT_SETTINGS.copy()
+        """Get a mutable copy of the default application settings"""
+        return dict(Config.DEFAULT_SETTINGS)
 
 class ConversationEntry:
     """Represents a single conversation entry"""
     
+    __slots__ = ('timestamp', 'transcription', 'ai_response', '_json', '_packed')
+    
     def __init__(self, timestamp, transcription: str, ai_response: str):
         self.timestamp = timestamp
         self.transcription = transcription
         self.ai_response = ai_response
+        self._json = None  # Cached serialized forms (entries never change)
+        self._packed = None
     
     def to_dict(self) -> Dict:
         return {
@@ -59,6 +78,54 @@ class ConversationEntry:
             'transcription': self.transcription,
             'ai_response': self.ai_response
         }
+    
+    def to_json(self) -> bytes:
+        """Serialized to_dict(), computed once per entry"""
+        if self._json is None:
+            # The datetime is passed as-is; orjson writes it as ISO 8601 in native code
+            self._json = storage.dumps({
+                'timestamp': self.timestamp,
+                'transcription': self.transcription,
+                'ai_response': self.ai_response
+            })
+        return self._json
+    
+    def to_packed(self) -> bytes:
+        """MessagePack record (epoch timestamp, transcription, response), computed once per entry"""
+        if self._packed is None:
+            self._packed = storage.pack((self.timestamp.timestamp(), self.transcription, self.ai_response))
+        return self._packed
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ConversationEntry':
+        return cls(
+            datetime.fromisoformat(data['timestamp']),
+            data['transcription'],
+            data['ai_response']
+        )
+    
+    @classmethod
+    def from_record(cls, record) -> 'ConversationEntry':
+        timestamp, transcription, ai_response = record
+        return cls(datetime.fromtimestamp(timestamp), transcription, ai_response)
+    
+    @classmethod
+    def from_dicts(cls, records) -> list:
+        """Batch from_dict() for loading history"""
+        fromisoformat = datetime.fromisoformat
+        return [
+            cls(fromisoformat(data['timestamp']), data['transcription'], data['ai_response'])
+            for data in records
+        ]
+    
+    @classmethod
+    def from_records(cls, records) -> list:
+        """Batch from_record() for loading history"""
+        fromtimestamp = datetime.fromtimestamp
+        return [
+            cls(fromtimestamp(timestamp), transcription, ai_response)
+            for timestamp, transcription, ai_response in records
+        ]
 
 class WindowExcluder:
     """Handles window exclusion for video conferencing apps"""
@@ -67,21 +134,34 @@ class WindowExcluder:
     EXCLUDED_PROCESSES = [
         'zoom', 'skype', 'microsoft teams', 'teams.exe', 'webex'
     ]
+    # Matched anywhere in a process name, so "zoom.us" or "CiscoWebexStart" count too
+    _EXCLUDED_RE = re.compile('|'.join(map(re.escape, EXCLUDED_PROCESSES)))
     
-    @staticmethod
-    def should_hide_overlay() -> bool:
+    # Auto-hiding is disabled for now as it's too aggressive - set to True to enable
+    ENABLED = False
+    CACHE_TTL = 1.0  # Seconds to reuse the last process scan
+    _last_check = 0.0
+    _cached_result = False
+    
+    @classmethod
+    def should_hide_overlay(cls) -> bool:
         """Check if overlay should be hidden based on active processes"""
-        try:
-            # For now, disable auto-hiding as it's too aggressive
-            # You can enable this by returning the logic below instead of False
+        if not cls.ENABLED:
             return False
-            
-            # Original logic (commented out):
-            # import psutil
-            # for proc in psutil.process_iter(['pid', 'name']):
-            #     proc_name = proc.info['name'].lower()
-            #     if any(excluded in proc_name for excluded in WindowExcluder.EXCLUDED_PROCESSES):
-            #         return True
-            # return False
+        
+        now = time.monotonic()
+        if now - cls._last_check < cls.CACHE_TTL:
+            return cls._cached_result
+        
+        try:
+            import psutil
+            result = any(
+                cls._EXCLUDED_RE.search((proc.info['name'] or '').lower())
+                for proc in psutil.process_iter(['name'])
+            )
         except Exception:
-            return False
\ No newline at end of file
+            result = False
+        
+        cls._last_check = now
+        cls._cached_result = result
+        return result
@@ -7,10 +7,10 @@ import signal
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QTimer
 
-from .ui import OverlayWidget
-
 def main():
     """Main application entry point"""
+    from .ui import OverlayWidget
+    
     # Enable high DPI scaling (for PyQt6 compatibility)
     try:
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
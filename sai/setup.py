@@ -6,19 +6,18 @@ SAI Setup - Handle optional Whisper installation and configuration
 import sys
 import subprocess
 import os
+import importlib.util
 from pathlib import Path
 import argparse
+from dotenv import set_key
 
 def check_whisper_available():
-    """Check if Whisper dependencies are available"""
-    try:
-        import whisper
-        import webrtcvad
-        import torch
-        return True
-    except ImportError as e:
-        print(f"Whisper dependencies not available: {e}")
+    """Check if Whisper dependencies are available (without importing them)"""
+    missing = [name for name in ('whisper', 'webrtcvad', 'torch') if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Whisper dependencies not available: {', '.join(missing)}")
         return False
+    return True
 
 def install_whisper():
     """Install Whisper dependencies"""
@@ -87,21 +86,9 @@ def setup_api_key():
     env_file = Path.home() / '.sai' / '.env'
     env_file.parent.mkdir(exist_ok=True)
     
-    # Read existing .env content
-    env_content = []
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            env_content = f.readlines()
-    
-    # Remove existing ANTHROPIC_API_KEY lines
-    env_content = [line for line in env_content if not line.startswith('ANTHROPIC_API_KEY=')]
-    
-    # Add new API key
-    env_content.append(f'ANTHROPIC_API_KEY={api_key}\\n')
-    
-    # Write back to file
-    with open(env_file, 'w') as f:
-        f.writelines(env_content)
+    # Replace or append the key in place
+    env_file.touch(exist_ok=True)
+    set_key(str(env_file), 'ANTHROPIC_API_KEY', api_key, quote_mode='never')
     
     print(f"✅ API key saved to {env_file}")
     
@@ -0,0 +1,130 @@
+"""
+Fast JSON and MessagePack persistence helpers for SAI settings and conversation data
+"""
+
+import json
+import mmap
+import os
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+def _default(obj):
+    """Stdlib fallback for the types orjson serializes natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes; datetimes are written as ISO 8601 strings"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_default).encode('utf-8')
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_atomic(path: Path, data: bytes):
+    """Write data to a temp file beside path and rename it into place"""
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+# Files at least this large are parsed straight from a memory map (orjson only)
+MMAP_THRESHOLD = 1 << 20
+
+def read_json(path: Path):
+    """Read and parse a JSON file in a single read, or from a memory map when large"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if ORJSON_AVAILABLE and size >= MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except OSError:
+                mm = None  # mmap unavailable for this file; fall back to a plain read
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+def write_json(path: Path, obj, indent: bool = False):
+    """Serialize obj and atomically replace path with it"""
+    write_atomic(path, dumps(obj, indent))
+
+def tail_jsonl(path: Path, count: int):
+    """Parse the last count records of a JSON Lines file; returns (records, total lines)
+
+    Earlier lines are only counted, never parsed. Blank or truncated lines are skipped.
+    """
+    total = 0
+    lines = deque(maxlen=count)
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                total += 1
+                lines.append(line)
+    
+    records = []
+    for line in lines:
+        try:
+            records.append(loads(line))
+        except ValueError:
+            # A crash mid-append can leave a partial last line
+            continue
+    return records, total
+
+def append_jsonl(path: Path, line: bytes):
+    """Append one pre-serialized record to a JSON Lines file"""
+    with open(path, 'ab') as f:
+        f.write(line + b'\n')
+
+def write_jsonl(path: Path, lines):
+    """Atomically rewrite a JSON Lines file from pre-serialized records"""
+    write_atomic(path, b''.join(line + b'\n' for line in lines))
+
+def pack(obj) -> bytes:
+    """Serialize obj to MessagePack bytes"""
+    return msgpack.packb(obj, use_bin_type=True)
+
+def tail_packed(path: Path, count: int):
+    """Read the last count of the MessagePack records written back to back; returns (records, total)
+
+    Reading stops at a truncated or corrupt tail.
+    """
+    total = 0
+    records = deque(maxlen=count)
+    with open(path, 'rb') as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        try:
+            for record in unpacker:
+                total += 1
+                records.append(record)
+        except (ValueError, msgpack.UnpackException):
+            # A crash mid-append can leave a partial last record
+            pass
+    return list(records), total
+
+def append_packed(path: Path, data: bytes):
+    """Append one pre-packed record to a MessagePack stream file"""
+    with open(path, 'ab') as f:
+        f.write(data)
+
+def write_packed(path: Path, records):
+    """Atomically rewrite a MessagePack stream file from pre-packed records"""
+    write_atomic(path, b''.join(records))
@@ -0,0 +1,212 @@
+"""
+Timeline model and delegate for SAI - renders conversation entries without per-entry widgets
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QEvent, QModelIndex, QRect, QSize
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt6.QtWidgets import QStyledItemDelegate
+
+# Role returning an entry's display lines: (timestamp, transcription, response)
+TextRole = Qt.ItemDataRole.UserRole + 1
+
+# Longest transcription/response shown before eliding; keeps per-row text layout bounded
+MAX_DISPLAY_CHARS = 300
+
+def elide(text, limit=MAX_DISPLAY_CHARS):
+    """Cut text to limit characters with an ellipsis; None disables the cap"""
+    if limit is None or len(text) <= limit:
+        return text
+    return text[:limit - 1] + "\u2026"
+
+def format_lines(timestamp, transcription, ai_response, limit=MAX_DISPLAY_CHARS):
+    """Display lines for one exchange; pure, so producers may call it on any thread"""
+    return (
+        f"[{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}]",
+        f">>> {elide(transcription, limit)}",
+        f"<<< {elide(ai_response, limit)}",
+    )
+
+def format_entry(entry, limit=MAX_DISPLAY_CHARS):
+    """Display lines for an entry; computed once when the entry is added"""
+    return format_lines(entry.timestamp, entry.transcription, entry.ai_response, limit)
+
+class TimelineModel(QAbstractListModel):
+    """List model holding the conversation entries shown in the timeline"""
+
+    def __init__(self, max_entries=100, parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        self.entries = []
+        self.texts = []  # format_entry() of each entry, same order
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == TextRole:
+            return self.texts[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{entry.transcription}\n{entry.ai_response}"
+        return None
+
+    def add_entry(self, entry, texts=None):
+        """Append an entry, dropping the oldest once the cap is reached
+        
+        texts may carry format_entry(entry) (or format_lines) computed by the producer
+        off the UI thread.
+        """
+        if texts is None:
+            texts = format_entry(entry)
+        if len(self.entries) >= self.max_entries:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            del self.entries[0]
+            del self.texts[0]
+            self.endRemoveRows()
+
+        row = len(self.entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.entries.append(entry)
+        self.texts.append(texts)
+        self.endInsertRows()
+
+    def toggle_expanded(self, row):
+        """Switch a row between its elided and full text; returns True if it changed"""
+        entry = self.entries[row]
+        full = format_entry(entry, None)
+        elided = format_entry(entry)
+        if full == elided:
+            return False
+        self.texts[row] = elided if self.texts[row] == full else full
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [TextRole])
+        return True
+
+    def set_entries(self, entries):
+        """Replace all entries in one model reset, keeping the newest max_entries"""
+        self.beginResetModel()
+        self.entries = list(entries)[-self.max_entries:]
+        self.texts = [format_entry(entry) for entry in self.entries]
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all entries"""
+        self.beginResetModel()
+        self.entries = []
+        self.texts = []
+        self.endResetModel()
+
+class TimelineDelegate(QStyledItemDelegate):
+    """Paints timestamp, transcription and response for one entry"""
+
+    MARGIN = 2
+    PADDING = 8
+    SPACING = 4
+    HEIGHT_CACHE_SIZE = 500  # Measured entries kept before the cache is dropped
+    TEXT_FLAGS = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop).value | Qt.TextFlag.TextWordWrap.value
+
+    BACKGROUND = QColor(10, 10, 10, 180)
+    BORDER = QColor(0, 255, 0, 60)
+    TIMESTAMP_COLOR = QColor("#00ff00")
+    TRANSCRIPTION_COLOR = QColor("#00ffff")
+    RESPONSE_COLOR = QColor("#00ff88")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.colors = (self.TIMESTAMP_COLOR, self.TRANSCRIPTION_COLOR, self.RESPONSE_COLOR)
+        self._base_font = None  # View font the line fonts were derived from
+
+        # Wrapped line heights per display text, valid for one text width and font
+        self._height_cache = {}
+        self._cache_width = None
+
+    def _sync_fonts(self, font):
+        """Derive the line fonts from the view's font, so the font size setting applies"""
+        if font == self._base_font:
+            return
+        self._base_font = QFont(font)
+
+        response_font = QFont(font)
+        response_font.setFamily("Courier New")
+        response_font.setStyleHint(QFont.StyleHint.Monospace)
+
+        transcription_font = QFont(response_font)
+        transcription_font.setBold(True)
+
+        # Timestamp stays a little smaller than the entry text (10px at the default 12px)
+        timestamp_font = QFont(response_font)
+        if font.pixelSize() > 0:
+            timestamp_font.setPixelSize(max(8, round(font.pixelSize() * 10 / 12)))
+        else:
+            timestamp_font.setPointSizeF(max(6.0, font.pointSizeF() * 10 / 12))
+
+        self.fonts = (timestamp_font, transcription_font, response_font)
+        self.metrics = tuple(QFontMetrics(f) for f in self.fonts)
+        self._height_cache.clear()
+
+    def _text_width(self, option):
+        """Width available for text inside the entry box"""
+        width = option.rect.width()
+        if width <= 0 and option.widget is not None:
+            width = option.widget.viewport().width()
+        return max(1, width - 2 * (self.MARGIN + self.PADDING))
+
+    def _line_heights(self, width, texts):
+        """Wrapped height of each line, measured once per text and width"""
+        if width != self._cache_width or len(self._height_cache) > self.HEIGHT_CACHE_SIZE:
+            self._height_cache.clear()
+            self._cache_width = width
+
+        heights = self._height_cache.get(texts)
+        if heights is None:
+            bounds = QRect(0, 0, width, 100000)
+            heights = tuple(
+                metrics.boundingRect(bounds, self.TEXT_FLAGS, text).height()
+                for metrics, text in zip(self.metrics, texts)
+            )
+            self._height_cache[texts] = heights
+        return heights
+
+    def sizeHint(self, option, index):
+        self._sync_fonts(option.font)
+        texts = index.data(TextRole)
+        heights = self._line_heights(self._text_width(option), texts)
+        height = sum(heights) + self.SPACING * (len(texts) - 1) + 2 * (self.MARGIN + self.PADDING)
+        return QSize(option.rect.width(), height)
+
+    def editorEvent(self, event, model, option, index):
+        # Double-click expands an elided entry in place (and collapses it again)
+        if event.type() == QEvent.Type.MouseButtonDblClick and model.toggle_expanded(index.row()):
+            self.sizeHintChanged.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def paint(self, painter, option, index):
+        self._sync_fonts(option.font)
+        texts = index.data(TextRole)
+        width = self._text_width(option)
+        heights = self._line_heights(width, texts)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Entry box
+        box = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        painter.setPen(self.BORDER)
+        painter.setBrush(self.BACKGROUND)
+        painter.drawRoundedRect(box, 5, 5)
+
+        # Text lines
+        x = box.left() + self.PADDING
+        y = box.top() + self.PADDING
+        for text, font, color, height in zip(texts, self.fonts, self.colors, heights):
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(QRect(x, y, width, height), self.TEXT_FLAGS, text)
+            y += height + self.SPACING
+
+        painter.restore()
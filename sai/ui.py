@@ -2,27 +2,445 @@
 UI components for SAI overlay
 """
 
-import json
 import os
+import time
+from collections import deque
+from functools import lru_cache, partial
 from datetime import datetime
+from difflib import SequenceMatcher
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
-    QPushButton, QLabel, QScrollArea, QFrame, QSystemTrayIcon, QMenu,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
+    QPushButton, QLabel, QFrame, QSystemTrayIcon, QMenu,
     QComboBox, QGroupBox, QDialog, QDialogButtonBox, QSlider, QCheckBox,
-    QTabWidget, QPlainTextEdit, QSpinBox, QSizeGrip
+    QTabWidget, QPlainTextEdit, QSpinBox, QSizeGrip, QListView, QAbstractItemView, QMessageBox
 )
 from PyQt6.QtCore import (
-    Qt, pyqtSignal, QTimer, QPoint, QSize, QMetaObject, Q_ARG
+    Qt, QEvent, pyqtSignal, pyqtSlot, QTimer, QPoint, QSize, QMetaObject, Q_ARG, QMutex, QThreadPool, QSignalBlocker
 )
 from PyQt6.QtGui import (
-    QFont, QPalette, QColor, QPixmap, QIcon, QAction
+    QFont, QPalette, QColor, QIcon, QFontMetrics
 )
 
+from . import storage
 from .config import Config, ConversationEntry, WindowExcluder
 from .claude_client import ClaudeClient
 from .audio import FastAudioListener, AudioListener, FAST_AUDIO_AVAILABLE
-from .ui_updater import UIUpdater
+from .ui_updater import UIUpdater, set_style_state
+from .timeline import TimelineModel, TimelineDelegate
+
+# One application-wide stylesheet, built once at import; only the overlay part depends
+# on a setting (font size). Settings dialog rules are scoped under QDialog#configDialog.
+_DIALOG_QSS = """
+    QDialog#configDialog {
+        background-color: rgba(30, 30, 30, 240);
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 8px;
+    }
+    QDialog#configDialog QTabWidget::pane {
+        border: 1px solid rgba(100, 100, 100, 150);
+        background-color: rgba(40, 40, 40, 200);
+        border-radius: 5px;
+    }
+    QDialog#configDialog QTabWidget::tab-bar {
+        alignment: center;
+    }
+    QDialog#configDialog QTabBar::tab {
+        background-color: rgba(60, 60, 60, 180);
+        padding: 8px 16px;
+        margin-right: 2px;
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-bottom: none;
+        border-radius: 5px 5px 0 0;
+    }
+    QDialog#configDialog QTabBar::tab:selected {
+        background-color: rgba(40, 40, 40, 200);
+        border-bottom: 1px solid rgba(40, 40, 40, 200);
+    }
+    QDialog#configDialog QTabBar::tab:hover {
+        background-color: rgba(80, 80, 80, 200);
+    }
+    QDialog#configDialog QGroupBox {
+        font-weight: bold;
+        color: #cccccc;
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 5px;
+        background-color: rgba(50, 50, 50, 100);
+    }
+    QDialog#configDialog QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: white;
+    }
+    QDialog#configDialog QLabel {
+        color: #cccccc;
+    }
+    QDialog#configDialog QSlider::groove:horizontal {
+        border: 1px solid rgba(100, 100, 100, 150);
+        height: 6px;
+        background: rgba(20, 20, 20, 200);
+        margin: 2px 0;
+        border-radius: 3px;
+    }
+    QDialog#configDialog QSlider::handle:horizontal {
+        background: rgba(0, 150, 255, 200);
+        border: 1px solid rgba(100, 100, 100, 150);
+        width: 14px;
+        margin: -5px 0;
+        border-radius: 7px;
+    }
+    QDialog#configDialog QSlider::handle:horizontal:hover {
+        background: rgba(0, 180, 255, 255);
+    }
+    QDialog#configDialog QComboBox {
+        background-color: rgba(60, 60, 60, 180);
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 3px;
+        padding: 5px;
+        min-height: 20px;
+    }
+    QDialog#configDialog QComboBox::drop-down {
+        background-color: rgba(80, 80, 80, 200);
+        border: none;
+        border-radius: 3px;
+    }
+    QDialog#configDialog QComboBox::down-arrow {
+        image: none;
+        border: none;
+    }
+    QDialog#configDialog QComboBox QAbstractItemView {
+        background-color: rgba(60, 60, 60, 240);
+        selection-background-color: rgba(0, 150, 255, 150);
+        border: 1px solid rgba(100, 100, 100, 150);
+    }
+    QDialog#configDialog QTextEdit, QDialog#configDialog QPlainTextEdit {
+        background-color: rgba(50, 50, 50, 180);
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 3px;
+        padding: 5px;
+    }
+    QDialog#configDialog QSpinBox {
+        background-color: rgba(60, 60, 60, 180);
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 3px;
+        padding: 2px;
+    }
+    QDialog#configDialog QSpinBox::up-button, QDialog#configDialog QSpinBox::down-button {
+        background-color: rgba(80, 80, 80, 200);
+        border: 1px solid rgba(100, 100, 100, 150);
+    }
+    QDialog#configDialog QSpinBox::up-button:hover, QDialog#configDialog QSpinBox::down-button:hover {
+        background-color: rgba(100, 100, 100, 200);
+    }
+    QDialog#configDialog QCheckBox {
+        spacing: 8px;
+    }
+    QDialog#configDialog QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 3px;
+        background-color: rgba(60, 60, 60, 180);
+    }
+    QDialog#configDialog QCheckBox::indicator:checked {
+        background-color: rgba(0, 150, 255, 200);
+    }
+    QDialog#configDialog QCheckBox::indicator:hover {
+        background-color: rgba(80, 80, 80, 200);
+    }
+    QDialog#configDialog QPushButton {
+        background-color: rgba(60, 60, 60, 180);
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 3px;
+        padding: 5px 15px;
+    }
+    QDialog#configDialog QPushButton:hover {
+        background-color: rgba(80, 80, 80, 200);
+    }
+    QDialog#configDialog QPushButton:pressed {
+        background-color: rgba(40, 40, 40, 200);
+    }
+    QDialog#configDialog QLabel#hint {
+        color: #666;
+    }
+    QDialog#configDialog QLabel#italicHint {
+        color: #666;
+        font-style: italic;
+    }
+    QDialog#configDialog QPlainTextEdit#monoEditor {
+        font-family: 'Courier New', monospace;
+        font-size: 11px;
+    }
+"""
+
+_OVERLAY_QSS_TEMPLATE = """
+    QWidget {{
+        color: white;
+        font-family: 'Arial', sans-serif;
+        font-size: {font_size}px;
+        background-color: transparent;
+    }}
+    QLabel {{
+        color: white;
+        font-size: {font_size}px;
+    }}
+    /* Context menu styling */
+    QMenu {{
+        background-color: rgba(20, 20, 20, 240);
+        color: #00ff00;
+        border: 1px solid rgba(0, 255, 0, 150);
+        border-radius: 5px;
+        padding: 5px;
+        font-family: 'Courier New', monospace;
+    }}
+    QMenu::item {{
+        background-color: transparent;
+        padding: 5px 10px;
+        border-radius: 3px;
+    }}
+    QMenu::item:selected {{
+        background-color: rgba(0, 255, 0, 50);
+        color: #00ff00;
+    }}
+    QMenu::item:pressed {{
+        background-color: rgba(0, 255, 0, 100);
+    }}
+    QMenu::separator {{
+        height: 1px;
+        background-color: rgba(0, 255, 0, 100);
+        margin: 5px;
+    }}
+    /* Title bar */
+    QFrame#titleBar {{
+        background-color: rgba(40, 40, 40, 180);
+        border-radius: 6px;
+        border: 1px solid rgba(120, 120, 120, 100);
+    }}
+    QLabel#titleLabel {{
+        color: white;
+        font-weight: bold;
+        font-size: 11px;
+    }}
+    QComboBox#micSelector {{
+        background-color: rgba(60, 60, 60, 180);
+        color: white;
+        border: 1px solid rgba(100, 100, 100, 150);
+        border-radius: 3px;
+        padding: 2px 5px;
+        min-width: 150px;
+    }}
+    QComboBox#micSelector::drop-down {{
+        border: none;
+        width: 20px;
+    }}
+    QComboBox#micSelector::down-arrow {{
+        color: white;
+    }}
+    QPushButton#audioInfoButton {{
+        background-color: rgba(0, 200, 255, 150);
+        color: white;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 10px;
+    }}
+    QPushButton#audioInfoButton:hover {{
+        background-color: rgba(0, 220, 255, 200);
+    }}
+    QPushButton#micToggleButton {{
+        background-color: rgba(0, 255, 0, 150);
+        color: white;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    QPushButton#micToggleButton:hover {{
+        background-color: rgba(0, 255, 0, 200);
+    }}
+    QPushButton#micToggleButton[state="off"] {{
+        background-color: rgba(255, 0, 0, 150);
+    }}
+    QPushButton#micToggleButton[state="off"]:hover {{
+        background-color: rgba(255, 0, 0, 200);
+    }}
+    QPushButton#configButton {{
+        background-color: rgba(100, 150, 255, 150);
+        color: white;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    QPushButton#configButton:hover {{
+        background-color: rgba(120, 170, 255, 200);
+    }}
+    QPushButton#hideButton {{
+        background-color: rgba(255, 200, 0, 150);
+        color: black;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 14px;
+    }}
+    QPushButton#hideButton:hover {{
+        background-color: rgba(255, 220, 0, 200);
+    }}
+    QPushButton#closeButton {{
+        background-color: rgba(255, 100, 100, 150);
+        color: white;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 14px;
+    }}
+    QPushButton#closeButton:hover {{
+        background-color: rgba(255, 120, 120, 200);
+    }}
+    /* Main content */
+    QFrame#contentFrame {{
+        background-color: rgba(20, 20, 20, 200);
+        border-radius: 8px;
+        border: 1px solid rgba(100, 100, 100, 100);
+    }}
+    QPlainTextEdit#transcriptionArea {{
+        background-color: rgba(10, 10, 10, 200);
+        color: #00ff00;
+        border: 1px solid rgba(0, 255, 0, 100);
+        border-radius: 5px;
+        padding: 8px;
+        font-family: 'Courier New', monospace;
+        font-size: 12px;
+    }}
+    QPlainTextEdit#currentResponse {{
+        background-color: rgba(5, 5, 15, 220);
+        color: #00ccff;
+        border: 1px solid rgba(0, 200, 255, 120);
+        border-radius: 5px;
+        padding: 8px;
+        font-family: 'Courier New', monospace;
+        font-size: 12px;
+    }}
+    QLabel#questionLabel {{
+        color: #00ff88;
+        font-weight: bold;
+        margin-top: 10px;
+    }}
+    QPlainTextEdit#questionInput {{
+        background-color: rgba(10, 10, 20, 200);
+        color: #00ffff;
+        border: 1px solid rgba(0, 255, 255, 100);
+        border-radius: 5px;
+        padding: 8px;
+        font-family: 'Courier New', monospace;
+        font-size: 12px;
+    }}
+    QPushButton#askButton {{
+        background-color: rgba(0, 255, 128, 150);
+        color: white;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+        padding: 5px 15px;
+    }}
+    QPushButton#askButton:hover {{
+        background-color: rgba(0, 255, 128, 200);
+    }}
+    QPushButton#exportButton {{
+        background-color: rgba(0, 150, 255, 150);
+        color: white;
+        border-radius: 3px;
+        padding: 5px;
+    }}
+    QPushButton#clearButton {{
+        background-color: rgba(255, 150, 0, 150);
+        color: white;
+        border-radius: 3px;
+        padding: 5px;
+    }}
+    QSizeGrip#sizeGrip {{
+        background-color: rgba(0, 255, 0, 100);
+        border: 1px solid rgba(0, 255, 0, 150);
+        border-radius: 3px;
+        width: 16px;
+        height: 16px;
+    }}
+    QSizeGrip#sizeGrip:hover {{
+        background-color: rgba(0, 255, 0, 150);
+    }}
+    /* Status indicators (state property set by the UI updater) */
+    QLabel#whisperStatus, QLabel#aiStatus {{
+        color: #666;
+        font-size: 16px;
+    }}
+    QLabel#whisperStatus[state="listening"] {{ color: #00ff00; }}
+    QLabel#whisperStatus[state="processing"] {{ color: #ff8800; }}
+    QLabel#whisperStatus[state="disabled"] {{ color: #ff0000; }}
+    QLabel#aiStatus[state="thinking"] {{ color: #0088ff; }}
+    QLabel#aiStatus[state="responding"] {{ color: #00ff88; }}
+    QLabel#aiStatus[state="error"] {{ color: #ff0000; }}
+    /* Timeline */
+    QListView#timelineView {{
+        background-color: rgba(5, 5, 5, 180);
+        border: 1px solid rgba(0, 255, 0, 80);
+        border-radius: 5px;
+    }}
+    QListView#timelineView QScrollBar:vertical {{
+        background: rgba(20, 20, 20, 200);
+        width: 12px;
+        border-radius: 6px;
+    }}
+    QListView#timelineView QScrollBar::handle:vertical {{
+        background: rgba(0, 255, 0, 150);
+        border-radius: 6px;
+        min-height: 20px;
+    }}
+    QListView#timelineView QScrollBar::handle:vertical:hover {{
+        background: rgba(0, 255, 0, 200);
+    }}
+"""
+
+def build_dark_palette():
+    """Application palette carrying the static dark-theme colors, so the stylesheet doesn't have to"""
+    palette = QPalette()
+    white = QColor("white")
+    for role, color in (
+        (QPalette.ColorRole.Window, QColor(30, 30, 30)),
+        (QPalette.ColorRole.WindowText, white),
+        (QPalette.ColorRole.Base, QColor(50, 50, 50)),
+        (QPalette.ColorRole.AlternateBase, QColor(60, 60, 60)),
+        (QPalette.ColorRole.Text, white),
+        (QPalette.ColorRole.PlaceholderText, QColor(140, 140, 140)),
+        (QPalette.ColorRole.Button, QColor(60, 60, 60)),
+        (QPalette.ColorRole.ButtonText, white),
+        (QPalette.ColorRole.Highlight, QColor(0, 150, 255)),
+        (QPalette.ColorRole.HighlightedText, white),
+        (QPalette.ColorRole.ToolTipBase, QColor(20, 20, 20)),
+        (QPalette.ColorRole.ToolTipText, white),
+    ):
+        palette.setColor(role, color)
+    return palette
+
+# Settings dialog descriptions of each AI response mode
+MODE_DESCRIPTIONS = MappingProxyType({
+    "default": "General helpful responses (50 words max)",
+    "meeting": "Focus on action items and decisions (30 words max)",
+    "learning": "Explanations and insights (40 words max)",
+    "summary": "Bullet point summaries (35 words max)",
+    "custom": "Use your own prompt template"
+})
+
+@lru_cache(maxsize=8)
+def build_app_stylesheet(font_size):
+    """Application stylesheet (overlay widgets plus the settings dialog) for a font size"""
+    return _OVERLAY_QSS_TEMPLATE.format(font_size=font_size) + _DIALOG_QSS
+
+TRAY_ICON_FILE = Path(__file__).with_name("tray.png")
+
+@lru_cache(maxsize=1)
+def get_tray_icon():
+    """Shared tray icon, loaded from the packaged PNG on first use"""
+    return QIcon(str(TRAY_ICON_FILE))
 
 class DraggableFrame(QFrame):
     """A frame that uses compositor-aware dragging"""
@@ -56,38 +474,75 @@ class DraggableFrame(QFrame):
 class ConfigDialog(QDialog):
     """Configuration dialog for settings"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent):
         super().__init__(parent)
         self.setWindowTitle("Overlay Assistant Settings")
         self.setModal(True)
         self.resize(500, 600)
         
-        # Load current settings
-        self.settings = getattr(parent, 'settings', Config.get_default_settings())
+        # Edit the overlay's settings in place
+        self.settings = parent.settings
         self.init_ui()
     
     def init_ui(self):
-        """Initialize the UI"""
+        """Initialize the UI; tabs other than the first are built when first shown"""
         layout = QVBoxLayout()
         
-        # Apply dark theme styling
-        self.setStyleSheet(self.get_dark_theme_style())
+        # Dark theme comes from the application stylesheet
+        self.setObjectName("configDialog")
+        
+        # Widgets of tabs not built yet stay None; accept() leaves their settings unchanged
+        self.mode_combo = None
+        self.fast_mode_cb = None
         
         # Create tabs
         tabs = QTabWidget()
         
         # Appearance tab
         appearance_tab = QWidget()
-        appearance_layout = QVBoxLayout(appearance_tab)
+        self._build_appearance_tab(QVBoxLayout(appearance_tab))
+        tabs.addTab(appearance_tab, "Appearance")
+        
+        # AI Mode and Performance tabs start as empty placeholders
+        ai_tab = QWidget()
+        tabs.addTab(ai_tab, "AI Settings")
+        perf_tab = QWidget()
+        tabs.addTab(perf_tab, "Performance")
+        self._tab_builders = {
+            tabs.indexOf(ai_tab): lambda: self._build_ai_tab(QVBoxLayout(ai_tab)),
+            tabs.indexOf(perf_tab): lambda: self._build_performance_tab(QVBoxLayout(perf_tab)),
+        }
+        tabs.currentChanged.connect(self._ensure_tab_built)
+        
+        layout.addWidget(tabs)
+        
+        # Buttons
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
         
+        self.setLayout(layout)
+        
+        # Wire on_<objectName>_<signal> slots (see the pyqtSlot names below)
+        QMetaObject.connectSlotsByName(self)
+    
+    def _ensure_tab_built(self, index):
+        """Build a tab's contents the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+    
+    def _build_appearance_tab(self, appearance_layout):
+        """Font, opacity, window size and transcription visibility"""
         # Font size
         font_group = QGroupBox("Font Size")
         font_layout = QVBoxLayout(font_group)
         
         self.font_slider = QSlider(Qt.Orientation.Horizontal)
+        self.font_slider.setObjectName("fontSlider")
         self.font_slider.setRange(8, 24)
         self.font_slider.setValue(self.settings.get('font_size', 12))
-        self.font_slider.valueChanged.connect(self.update_font_label)
         
         self.font_label = QLabel(f"Font Size: {self.settings.get('font_size', 12)}px")
         font_layout.addWidget(self.font_label)
@@ -99,9 +554,9 @@ class ConfigDialog(QDialog):
         opacity_layout = QVBoxLayout(opacity_group)
         
         self.opacity_slider = QSlider(Qt.Orientation.Horizontal)
+        self.opacity_slider.setObjectName("opacitySlider")
         self.opacity_slider.setRange(30, 100)
         self.opacity_slider.setValue(int(self.settings.get('opacity', 0.9) * 100))
-        self.opacity_slider.valueChanged.connect(self.update_opacity_label)
         
         self.opacity_label = QLabel(f"Opacity: {int(self.settings.get('opacity', 0.9) * 100)}%")
         opacity_layout.addWidget(self.opacity_label)
@@ -134,13 +589,9 @@ class ConfigDialog(QDialog):
         self.show_transcription_cb = QCheckBox("Show transcribed text")
         self.show_transcription_cb.setChecked(self.settings.get('show_transcription', True))
         appearance_layout.addWidget(self.show_transcription_cb)
-        
-        tabs.addTab(appearance_tab, "Appearance")
-        
-        # AI Mode tab
-        ai_tab = QWidget()
-        ai_layout = QVBoxLayout(ai_tab)
-        
+    
+    def _build_ai_tab(self, ai_layout):
+        """Response mode, template editors and custom prompt"""
         # Mode selection
         mode_group = QGroupBox("AI Response Mode")
         mode_layout = QVBoxLayout(mode_group)
@@ -151,18 +602,9 @@ class ConfigDialog(QDialog):
         self.mode_combo.currentTextChanged.connect(self.on_mode_changed)
         mode_layout.addWidget(self.mode_combo)
         
-        # Mode descriptions
-        mode_desc = {
-            "default": "General helpful responses (50 words max)",
-            "meeting": "Focus on action items and decisions (30 words max)", 
-            "learning": "Explanations and insights (40 words max)",
-            "summary": "Bullet point summaries (35 words max)",
-            "custom": "Use your own prompt template"
-        }
-        
-        self.mode_desc_label = QLabel(mode_desc.get(self.settings.get('mode', 'default'), ''))
+        self.mode_desc_label = QLabel(MODE_DESCRIPTIONS.get(self.settings.get('mode', 'default'), ''))
         self.mode_desc_label.setWordWrap(True)
-        self.mode_desc_label.setStyleSheet("color: #666; font-style: italic;")
+        self.mode_desc_label.setObjectName("italicHint")
         mode_layout.addWidget(self.mode_desc_label)
         
         ai_layout.addWidget(mode_group)
@@ -194,7 +636,7 @@ class ConfigDialog(QDialog):
             editor = QPlainTextEdit()
             editor.setPlainText(self.settings.get(f'template_{template_key}', ''))
             editor.setMaximumHeight(80)
-            editor.setStyleSheet("font-family: 'Courier New', monospace; font-size: 11px;")
+            editor.setObjectName("monoEditor")
             
             tab_layout.addWidget(editor)
             template_tabs.addTab(tab_widget, template_name)
@@ -212,18 +654,14 @@ class ConfigDialog(QDialog):
         self.custom_prompt_edit = QPlainTextEdit()
         self.custom_prompt_edit.setPlainText(self.settings.get('custom_prompt', ''))
         self.custom_prompt_edit.setMaximumHeight(80)
-        self.custom_prompt_edit.setStyleSheet("font-family: 'Courier New', monospace; font-size: 11px;")
+        self.custom_prompt_edit.setObjectName("monoEditor")
         self.custom_prompt_edit.setEnabled(self.settings.get('mode') == 'custom')
         custom_layout.addWidget(self.custom_prompt_edit)
         
         ai_layout.addWidget(custom_group)
-        
-        tabs.addTab(ai_tab, "AI Settings")
-        
-        # Performance tab
-        perf_tab = QWidget()
-        perf_layout = QVBoxLayout(perf_tab)
-        
+    
+    def _build_performance_tab(self, perf_layout):
+        """Audio processing mode and API info"""
         # Audio processing mode
         audio_group = QGroupBox("Audio Processing")
         audio_layout = QVBoxLayout(audio_group)
@@ -234,7 +672,7 @@ class ConfigDialog(QDialog):
         audio_layout.addWidget(self.fast_mode_cb)
         
         fallback_label = QLabel("When unchecked, uses Google Speech Recognition (slower but more accurate)")
-        fallback_label.setStyleSheet("font-style: italic; color: #666;")
+        fallback_label.setObjectName("italicHint")
         audio_layout.addWidget(fallback_label)
         
         perf_layout.addWidget(audio_group)
@@ -244,223 +682,123 @@ class ConfigDialog(QDialog):
         api_layout = QVBoxLayout(api_group)
         
         cache_label = QLabel("Response caching: Enabled (improves speed for repeated queries)")
-        cache_label.setStyleSheet("color: #666;")
+        cache_label.setObjectName("hint")
         api_layout.addWidget(cache_label)
         
         async_label = QLabel("Async processing: Enabled (non-blocking API calls)")
-        async_label.setStyleSheet("color: #666;")
+        async_label.setObjectName("hint")
         api_layout.addWidget(async_label)
         
         perf_layout.addWidget(api_group)
         
         perf_layout.addStretch()
-        
-        tabs.addTab(perf_tab, "Performance")
-        
-        layout.addWidget(tabs)
-        
-        # Buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-        
-        self.setLayout(layout)
     
     def accept(self):
-        """Override accept to save template settings"""
-        # Save template settings
-        if hasattr(self, 'template_editors'):
+        """Write the values of every tab that was opened back into settings"""
+        self.settings['font_size'] = self.font_slider.value()
+        self.settings['opacity'] = self.opacity_slider.value() / 100.0
+        self.settings['window_width'] = self.width_spin.value()
+        self.settings['window_height'] = self.height_spin.value()
+        self.settings['show_transcription'] = self.show_transcription_cb.isChecked()
+        
+        if self.mode_combo is not None:
+            self.settings['mode'] = self.mode_combo.currentText()
+            self.settings['custom_prompt'] = self.custom_prompt_edit.toPlainText()
             for template_key, editor in self.template_editors.items():
                 self.settings[f'template_{template_key}'] = editor.toPlainText()
         
-        # Update parent settings
-        if hasattr(self, 'parent') and self.parent():
-            self.parent().settings.update(self.settings)
+        if self.fast_mode_cb is not None:
+            self.settings['use_fast_mode'] = self.fast_mode_cb.isChecked()
         
         super().accept()
     
+    @pyqtSlot(int, name="on_fontSlider_valueChanged")
     def update_font_label(self, value):
         """Update font size label"""
         self.font_label.setText(f"Font Size: {value}px")
     
+    @pyqtSlot(int, name="on_opacitySlider_valueChanged")
     def update_opacity_label(self, value):
         """Update opacity label"""
         self.opacity_label.setText(f"Opacity: {value}%")
     
     def on_mode_changed(self, mode):
         """Handle AI mode change"""
-        mode_desc = {
-            "default": "General helpful responses (50 words max)",
-            "meeting": "Focus on action items and decisions (30 words max)", 
-            "learning": "Explanations and insights (40 words max)",
-            "summary": "Bullet point summaries (35 words max)",
-            "custom": "Use your own prompt template"
-        }
-        
-        self.mode_desc_label.setText(mode_desc.get(mode, ''))
+        self.mode_desc_label.setText(MODE_DESCRIPTIONS.get(mode, ''))
         self.custom_prompt_edit.setEnabled(mode == 'custom')
-    
-    def get_dark_theme_style(self):
-        """Get dark theme stylesheet"""
-        return """
-            QDialog {
-                background-color: rgba(30, 30, 30, 240);
-                color: white;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 8px;
-            }
-            QTabWidget::pane {
-                border: 1px solid rgba(100, 100, 100, 150);
-                background-color: rgba(40, 40, 40, 200);
-                border-radius: 5px;
-            }
-            QTabWidget::tab-bar {
-                alignment: center;
-            }
-            QTabBar::tab {
-                background-color: rgba(60, 60, 60, 180);
-                color: white;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-bottom: none;
-                border-radius: 5px 5px 0 0;
-            }
-            QTabBar::tab:selected {
-                background-color: rgba(40, 40, 40, 200);
-                border-bottom: 1px solid rgba(40, 40, 40, 200);
-            }
-            QTabBar::tab:hover {
-                background-color: rgba(80, 80, 80, 200);
-            }
-            QGroupBox {
-                font-weight: bold;
-                color: #cccccc;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 5px;
-                background-color: rgba(50, 50, 50, 100);
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: white;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid rgba(100, 100, 100, 150);
-                height: 6px;
-                background: rgba(20, 20, 20, 200);
-                margin: 2px 0;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: rgba(0, 150, 255, 200);
-                border: 1px solid rgba(100, 100, 100, 150);
-                width: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: rgba(0, 180, 255, 255);
-            }
-            QComboBox {
-                background-color: rgba(60, 60, 60, 180);
-                color: white;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 3px;
-                padding: 5px;
-                min-height: 20px;
-            }
-            QComboBox::drop-down {
-                background-color: rgba(80, 80, 80, 200);
-                border: none;
-                border-radius: 3px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: rgba(60, 60, 60, 240);
-                color: white;
-                selection-background-color: rgba(0, 150, 255, 150);
-                border: 1px solid rgba(100, 100, 100, 150);
-            }
-            QTextEdit, QPlainTextEdit {
-                background-color: rgba(50, 50, 50, 180);
-                color: white;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 3px;
-                padding: 5px;
-            }
-            QSpinBox {
-                background-color: rgba(60, 60, 60, 180);
-                color: white;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 3px;
-                padding: 2px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: rgba(80, 80, 80, 200);
-                border: 1px solid rgba(100, 100, 100, 150);
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: rgba(100, 100, 100, 200);
-            }
-            QCheckBox {
-                spacing: 8px;
-                color: white;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 3px;
-                background-color: rgba(60, 60, 60, 180);
-            }
-            QCheckBox::indicator:checked {
-                background-color: rgba(0, 150, 255, 200);
-            }
-            QCheckBox::indicator:hover {
-                background-color: rgba(80, 80, 80, 200);
-            }
-            QPushButton {
-                background-color: rgba(60, 60, 60, 180);
-                color: white;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 3px;
-                padding: 5px 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(80, 80, 80, 200);
-            }
-            QPushButton:pressed {
-                background-color: rgba(40, 40, 40, 200);
-            }
-        """
 
 class OverlayWidget(QWidget):
     """Main overlay widget"""
     
+    MAX_HISTORY = 100  # Conversation entries kept in memory
+    HISTORY_COMPACT_FACTOR = 10  # Compact the history log once it holds this many times MAX_HISTORY
+    DUPLICATE_RATIO = 0.95  # Transcriptions at least this similar to the previous one are dropped
+    DUPLICATE_WINDOW = 10.0  # Seconds after a transcription during which repeats of it are dropped
+    SETTINGS_FLUSH_DELAY = 2000  # ms of quiet before changed settings are written
+    
+    # Emitted from the I/O thread: entries, log line count, whether read from the legacy file,
+    # history generation the load started in
+    history_loaded = pyqtSignal(object, int, bool, int)
+    # Emitted from the Claude client's worker thread (UIUpdater's streaming on_done):
+    # transcription, AI response, timestamp, timeline display lines; queued to
+    # _on_ai_response on the main thread
+    ai_response_ready = pyqtSignal(str, str, object, object)
+    
     def __init__(self):
         super().__init__()
         self.settings_file = Path.home() / ".overlay_assistant_settings.json"
-        self.data_file = Path.home() / ".overlay_assistant_data.json"
+        # History is a MessagePack stream when msgpack is installed, JSON Lines otherwise;
+        # older formats are read once and migrated on close
+        jsonl_file = Path.home() / ".overlay_assistant_data.jsonl"
+        legacy_json_file = Path.home() / ".overlay_assistant_data.json"
+        if storage.MSGPACK_AVAILABLE:
+            self.data_file = Path.home() / ".overlay_assistant_data.mpk"
+            self.legacy_data_files = (jsonl_file, legacy_json_file)
+        else:
+            self.data_file = jsonl_file
+            self.legacy_data_files = (legacy_json_file,)
+        self._history_log_lines = 0
+        self._history_ready = False  # False until the saved history has been read
+        self._history_generation = 0  # Bumped by clear_timeline; older loads are discarded
+        self._migrate_legacy = False
+        
+        # Disk writes are coalesced and run off the UI thread; a single
+        # I/O thread keeps history appends in order
+        self._saved_settings = None  # Last settings snapshot written (or loaded), to skip no-op saves
+        self._io_mutex = QMutex()
+        self._io_pool = QThreadPool()
+        self._io_pool.setMaxThreadCount(1)
+        
+        # Settings changes are written once they stop for SETTINGS_FLUSH_DELAY ms
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.timeout.connect(self._flush_save)
+        
+        # Window position is saved once moves stop for a second; start() restarts the countdown
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self.save_window_position)
         
-        # Load settings and data
+        # Load settings now; history is parsed on the I/O thread and merged in later
         self.settings = self.load_settings()
-        self.conversation_history = self.load_conversation_history()
+        QApplication.setPalette(build_dark_palette())
+        self.conversation_history = deque(maxlen=self.MAX_HISTORY)
+        self._recent_context = ""
+        self._last_transcription_norm = ""
+        self._last_transcription_time = 0.0  # time.monotonic() of the last accepted transcription
+        self.history_loaded.connect(self._on_history_loaded)
+        self.ai_response_ready.connect(self._on_ai_response)
         
         # Initialize components
         self.claude_client = None
         self.audio_listener = None
+        self._stopping_listeners = set()  # Stopped listeners whose threads have not finished yet
+        self._styled_font_size = None  # Font size the current stylesheet was built for
+        self._current_device_index = None  # Device the running listener was started with
         self.mic_enabled = True
+        self._whisper_status = None  # Last Whisper status requested
+        self.tray_icon = None  # Stays None if the system tray is unavailable
+        self._current_audio_mode = self.settings.get('use_fast_mode', True)
         
         self.init_ui()
         self.init_claude_client()
@@ -468,10 +806,11 @@ class OverlayWidget(QWidget):
         # Initialize UI updater BEFORE audio to avoid threading issues
         self.ui_updater = UIUpdater(self)
         
-        # Initialize system tray
-        self.init_system_tray()
+        # Create the system tray once the event loop is running, after the first paint
+        QTimer.singleShot(0, self.init_system_tray)
         
         self.init_audio()
+        self.load_conversation_history()
     
     def init_system_tray(self):
         """Initialize system tray icon"""
@@ -483,32 +822,16 @@ class OverlayWidget(QWidget):
         # Create tray icon
         self.tray_icon = QSystemTrayIcon(self)
         
-        # Create a simple icon (you could use a proper icon file instead)
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(QColor(0, 255, 0))  # Green square
-        self.tray_icon.setIcon(QIcon(pixmap))
-        
-        # Create tray menu
-        tray_menu = QMenu()
-        
-        # Show/Hide action
-        self.show_action = QAction("Show SAI", self)
-        self.show_action.triggered.connect(self.show_from_tray)
-        tray_menu.addAction(self.show_action)
-        
-        # Toggle microphone action
-        self.mic_action = QAction("Toggle Microphone", self)
-        self.mic_action.triggered.connect(self.toggle_microphone)
-        tray_menu.addAction(self.mic_action)
+        self.tray_icon.setIcon(get_tray_icon())
         
-        tray_menu.addSeparator()
+        # Create tray menu; addAction(text, slot) builds and connects each action in one call
+        self.tray_menu = QMenu(self)
+        self.show_action = self.tray_menu.addAction("Show SAI", self.show_from_tray)
+        self.mic_action = self.tray_menu.addAction("Toggle Microphone", self.toggle_microphone)
+        self.tray_menu.addSeparator()
+        self.tray_menu.addAction("Quit", self.quit_application)
         
-        # Quit action
-        quit_action = QAction("Quit", self)
-        quit_action.triggered.connect(self.quit_application)
-        tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.setContextMenu(self.tray_menu)
         
         # Handle tray icon activation (double-click)
         self.tray_icon.activated.connect(self.on_tray_activated)
@@ -519,6 +842,11 @@ class OverlayWidget(QWidget):
         # Update tooltip
         self.tray_icon.setToolTip("SAI - Smart AI Assistant")
         
+    def showEvent(self, event):
+        """Apply display updates that were held back while the overlay was hidden"""
+        super().showEvent(event)
+        self.ui_updater.flush_deferred()
+    
     def show_from_tray(self):
         """Show window from system tray"""
         self.show()
@@ -533,25 +861,26 @@ class OverlayWidget(QWidget):
             else:
                 self.show_from_tray()
                 
+    @pyqtSlot(name="on_closeButton_clicked")
     def quit_application(self):
         """Properly quit the application"""
-        if hasattr(self, 'tray_icon'):
+        if self.tray_icon is not None:
             self.tray_icon.hide()
         self.close()
         QApplication.quit()
     
+    @pyqtSlot(name="on_hideButton_clicked")
     def hide_to_tray(self):
         """Hide window to system tray"""
-        if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
+        if self.tray_icon is not None and self.tray_icon.isVisible():
             self.hide()
             # Show tray notification
-            if hasattr(self.tray_icon, 'showMessage'):
-                self.tray_icon.showMessage(
-                    "SAI Hidden",
-                    "SAI is still running in the system tray. Double-click to restore.",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    3000
-                )
+            self.tray_icon.showMessage(
+                "SAI Hidden",
+                "SAI is still running in the system tray. Double-click to restore.",
+                QSystemTrayIcon.MessageIcon.Information,
+                3000
+            )
         else:
             # Fallback to regular hide if tray not available
             self.hide()
@@ -560,56 +889,178 @@ class OverlayWidget(QWidget):
         """Load settings from file"""
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r') as f:
-                    loaded_settings = json.load(f)
-                    # Merge with defaults
-                    settings = Config.get_default_settings()
-                    settings.update(loaded_settings)
-                    return settings
+                loaded_settings = storage.read_json(self.settings_file)
+                # Merge with defaults
+                settings = {**Config.DEFAULT_SETTINGS, **loaded_settings}
+                self._saved_settings = dict(settings)
+                return settings
         except Exception as e:
             print(f"Error loading settings: {e}")
         
         return Config.get_default_settings()
     
     def save_settings(self):
-        """Save settings to file"""
+        """Save settings to file immediately (skipped if nothing changed since the last save)"""
+        snapshot = self._take_settings_snapshot()
+        if snapshot is not None:
+            self._write_settings(snapshot)
+    
+    def _take_settings_snapshot(self):
+        """Copy of the settings to write, or None if they match what is on disk"""
+        if self.settings == self._saved_settings:
+            return None
+        snapshot = dict(self.settings)
+        self._saved_settings = snapshot
+        return snapshot
+    
+    def _write_settings(self, settings):
+        """Write a settings snapshot to disk (any thread)"""
+        self._io_mutex.lock()
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            storage.write_json(self.settings_file, settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
+        finally:
+            self._io_mutex.unlock()
+    
+    def schedule_save(self):
+        """Coalesce settings writes into one background flush"""
+        self._settings_flush_timer.start(self.SETTINGS_FLUSH_DELAY)
+    
+    def _flush_save(self):
+        """Hand the pending settings write to the I/O thread"""
+        snapshot = self._take_settings_snapshot()
+        if snapshot is not None:
+            self._io_pool.start(partial(self._write_settings, snapshot))
+    
+    def flush_now(self):
+        """Finish queued writes and save settings synchronously"""
+        self._settings_flush_timer.stop()
+        self._io_pool.waitForDone()
+        self.save_settings()
     
     def load_conversation_history(self):
-        """Load conversation history from file"""
+        """Start loading conversation history; results arrive via history_loaded"""
+        self._io_pool.start(partial(self._read_conversation_history, self._history_generation))
+    
+    def _read_conversation_history(self, generation):
+        """Parse the history log (runs on the I/O thread)"""
+        log_lines = 0
+        from_legacy = False
         try:
-            if self.data_file.exists():
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    history = []
-                    for entry_data in data.get('conversation_history', []):
-                        timestamp = datetime.fromisoformat(entry_data['timestamp'])
-                        entry = ConversationEntry(
-                            timestamp, 
-                            entry_data['transcription'], 
-                            entry_data['ai_response']
-                        )
-                        history.append(entry)
-                    return history
+            entries = []
+            for path in (self.data_file, *self.legacy_data_files):
+                if path.exists():
+                    records, total, make_entries = self._read_history_file(path, self.MAX_HISTORY)
+                    entries = make_entries(records)
+                    from_legacy = path != self.data_file
+                    if not from_legacy:
+                        log_lines = total
+                    break
         except Exception as e:
             print(f"Error loading conversation history: {e}")
+            entries = []
         
-        return []
+        self.history_loaded.emit(entries, log_lines, from_legacy, generation)
     
-    def save_conversation_history(self):
-        """Save conversation history to file"""
+    @staticmethod
+    def _read_history_file(path, count):
+        """Read the last count raw records of a history file of any format.
+
+        Returns (records, total records in the file, matching batch entry constructor).
+        """
+        if path.suffix == '.mpk':
+            return (*storage.tail_packed(path, count), ConversationEntry.from_records)
+        if path.suffix == '.jsonl':
+            return (*storage.tail_jsonl(path, count), ConversationEntry.from_dicts)
+        records = storage.read_json(path).get('conversation_history', [])
+        return records[-count:], len(records), ConversationEntry.from_dicts
+    
+    @staticmethod
+    def _encode_entry(entry):
+        """Serialize an entry for the history log"""
+        if storage.MSGPACK_AVAILABLE:
+            return entry.to_packed()
+        return entry.to_json()
+    
+    def _on_history_loaded(self, entries, log_lines, from_legacy, generation):
+        """Merge loaded history with any entries added while it was loading"""
+        if generation != self._history_generation:
+            # The history was cleared while loading; the file has been truncated already
+            self._history_ready = True
+            return
+        self.conversation_history = deque([*entries, *self.conversation_history], maxlen=self.MAX_HISTORY)
+        self._history_log_lines += log_lines
+        self._migrate_legacy = from_legacy
+        self._history_ready = True
+        
+        self.update_recent_context()
+        self.repopulate_timeline(self.conversation_history)
+    
+    def update_recent_context(self):
+        """Rebuild the Claude context string from the last two transcriptions"""
+        history = self.conversation_history
+        recent_entries = islice(history, max(0, len(history) - 2), None)
+        context = " ".join(entry.transcription for entry in recent_entries)
+        self._recent_context = context[-200:]
+    
+    def record_exchange(self, text, ai_response, timestamp=None):
+        """Add a transcription/response pair to the history and the log; returns the entry
+        
+        Main thread only: the history deque and log line count are shared with loading,
+        clearing, export and compaction.
+        """
+        entry = ConversationEntry(timestamp or datetime.now(), text, ai_response)
+        self.conversation_history.append(entry)  # deque drops the oldest past MAX_HISTORY
+        self.update_recent_context()
+        self.append_conversation_entry(entry)
+        return entry
+    
+    def append_conversation_entry(self, entry: ConversationEntry):
+        """Append a single entry to the history log (on the I/O thread)"""
+        line = self._encode_entry(entry)
+        self._history_log_lines += 1
+        self._io_pool.start(partial(self._append_history_record, line))
+    
+    def _append_history_record(self, line):
+        self._io_mutex.lock()
         try:
-            data = {
-                'conversation_history': [entry.to_dict() for entry in self.conversation_history]
-            }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if storage.MSGPACK_AVAILABLE:
+                storage.append_packed(self.data_file, line)
+            else:
+                storage.append_jsonl(self.data_file, line)
+        except Exception as e:
+            print(f"Error appending conversation entry: {e}")
+        finally:
+            self._io_mutex.unlock()
+    
+    def _write_history(self, lines):
+        self._io_mutex.lock()
+        try:
+            if storage.MSGPACK_AVAILABLE:
+                storage.write_packed(self.data_file, lines)
+            else:
+                storage.write_jsonl(self.data_file, lines)
         except Exception as e:
             print(f"Error saving conversation history: {e}")
+        finally:
+            self._io_mutex.unlock()
+    
+    def save_conversation_history(self):
+        """Rewrite the history log with only the current entries"""
+        self._io_pool.waitForDone()
+        self._write_history([self._encode_entry(entry) for entry in self.conversation_history])
+        self._history_log_lines = len(self.conversation_history)
+    
+    def compact_conversation_history(self):
+        """Compact the history log if it has grown well past the in-memory cap"""
+        if not self._history_ready:
+            # Closed before history finished loading; the log on disk is still complete
+            return
+        if (self._migrate_legacy or not self.data_file.exists()
+                or self._history_log_lines > self.MAX_HISTORY * self.HISTORY_COMPACT_FACTOR):
+            self.save_conversation_history()
+            self._migrate_legacy = False
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -635,31 +1086,15 @@ class OverlayWidget(QWidget):
         
         # Main content
         content_frame = QFrame()
-        content_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(20, 20, 20, 200);
-                border-radius: 8px;
-                border: 1px solid rgba(100, 100, 100, 100);
-            }
-        """)
+        content_frame.setObjectName("contentFrame")
         
         content_layout = QVBoxLayout(content_frame)
         
         # Current transcription area
-        self.transcription_area = QTextEdit()
+        self.transcription_area = QPlainTextEdit()
         self.transcription_area.setPlaceholderText("Listening for speech...")
         self.transcription_area.setMaximumHeight(60)
-        self.transcription_area.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(10, 10, 10, 200);
-                color: #00ff00;
-                border: 1px solid rgba(0, 255, 0, 100);
-                border-radius: 5px;
-                padding: 8px;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
+        self.transcription_area.setObjectName("transcriptionArea")
         content_layout.addWidget(self.transcription_area)
         
         # Response area with status indicators
@@ -668,11 +1103,11 @@ class OverlayWidget(QWidget):
         
         # Status indicators
         self.whisper_status = QLabel("🎤")
-        self.whisper_status.setStyleSheet("color: #666; font-size: 16px;")
+        self.whisper_status.setObjectName("whisperStatus")
         self.whisper_status.setToolTip("Speech recognition status")
         
         self.ai_status = QLabel("🤖")
-        self.ai_status.setStyleSheet("color: #666; font-size: 16px;")
+        self.ai_status.setObjectName("aiStatus")
         self.ai_status.setToolTip("AI processing status")
         
         response_header.addStretch()
@@ -682,76 +1117,30 @@ class OverlayWidget(QWidget):
         content_layout.addLayout(response_header)
         
         # Current response
-        self.current_response = QTextEdit()
+        self.current_response = QPlainTextEdit()
         self.current_response.setPlaceholderText("AI responses will appear here...")
         self.current_response.setMaximumHeight(80)
-        self.current_response.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(5, 5, 15, 220);
-                color: #00ccff;
-                border: 1px solid rgba(0, 200, 255, 120);
-                border-radius: 5px;
-                padding: 8px;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-            QTextEdit::placeholder {
-                color: rgba(0, 200, 255, 100);
-            }
-        """)
+        self.current_response.setObjectName("currentResponse")
         content_layout.addWidget(self.current_response)
         
         # Question input area
         question_label = QLabel("Ask a Question:")
-        question_label.setStyleSheet("color: #00ff88; font-weight: bold; margin-top: 10px;")
+        question_label.setObjectName("questionLabel")
         content_layout.addWidget(question_label)
         
         question_layout = QHBoxLayout()
-        self.question_input = QTextEdit()
+        self.question_input = QPlainTextEdit()
         self.question_input.setPlaceholderText("Type your question here...")
         self.question_input.setMaximumHeight(60)
-        self.question_input.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(10, 10, 20, 200);
-                color: #00ffff;
-                border: 1px solid rgba(0, 255, 255, 100);
-                border-radius: 5px;
-                padding: 8px;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-            QTextEdit::placeholder {
-                color: rgba(0, 255, 255, 100);
-            }
-        """)
+        self.question_input.setObjectName("questionInput")
         
-        # Handle Enter key for question input
-        def handle_question_key_press(event):
-            if event.key() == Qt.Key.Key_Return and not event.modifiers():
-                self.ask_question()
-                event.accept()
-            else:
-                QTextEdit.keyPressEvent(self.question_input, event)
-        
-        self.question_input.keyPressEvent = handle_question_key_press
+        # Enter submits the question (see eventFilter)
+        self.question_input.installEventFilter(self)
         question_layout.addWidget(self.question_input)
         
         self.ask_btn = QPushButton("Ask")
-        self.ask_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 255, 128, 150);
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 5px 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 255, 128, 200);
-            }
-        """)
+        self.ask_btn.setObjectName("askButton")
         self.ask_btn.setFixedHeight(60)
-        self.ask_btn.clicked.connect(self.ask_question)
         question_layout.addWidget(self.ask_btn)
         
         content_layout.addLayout(question_layout)
@@ -760,43 +1149,36 @@ class OverlayWidget(QWidget):
         timeline_label = QLabel("Timeline:")
         content_layout.addWidget(timeline_label)
         
-        self.timeline_scroll = QScrollArea()
-        self.timeline_scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: rgba(5, 5, 5, 180);
-                border: 1px solid rgba(0, 255, 0, 80);
-                border-radius: 5px;
-            }
-            QScrollBar:vertical {
-                background: rgba(20, 20, 20, 200);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(0, 255, 0, 150);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(0, 255, 0, 200);
-            }
-        """)
-        self.timeline_widget = QWidget()
-        self.timeline_layout = QVBoxLayout(self.timeline_widget)
-        self.timeline_scroll.setWidget(self.timeline_widget)
-        self.timeline_scroll.setWidgetResizable(True)
-        content_layout.addWidget(self.timeline_scroll)
+        # Model/delegate view: entries are painted, not built from widgets
+        self.timeline_model = TimelineModel(self.MAX_HISTORY, self)
+        self.timeline_view = QListView()
+        self.timeline_view.setObjectName("timelineView")
+        self.timeline_view.setModel(self.timeline_model)
+        self.timeline_view.setItemDelegate(TimelineDelegate(self.timeline_view))
+        self.timeline_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.timeline_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.timeline_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.timeline_view.setWordWrap(True)
+        # Lay out rows in batches so restoring a full history doesn't block the event loop
+        self.timeline_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.timeline_view.setBatchSize(20)
+        
+        # Keep following new entries while the view is scrolled to the bottom; the
+        # scroll happens when the layout actually grows, so no delayed scroll is needed
+        self._follow_timeline = True
+        scroll_bar = self.timeline_view.verticalScrollBar()
+        scroll_bar.rangeChanged.connect(self._on_timeline_range_changed)
+        scroll_bar.valueChanged.connect(self._on_timeline_scrolled)
+        content_layout.addWidget(self.timeline_view)
         
         # Control buttons
         button_layout = QHBoxLayout()
         
         self.export_btn = QPushButton("Export")
-        self.export_btn.setStyleSheet("background-color: rgba(0, 150, 255, 150); color: white; border-radius: 3px; padding: 5px;")
-        self.export_btn.clicked.connect(self.export_data)
+        self.export_btn.setObjectName("exportButton")
         
         self.clear_btn = QPushButton("Clear")
-        self.clear_btn.setStyleSheet("background-color: rgba(255, 150, 0, 150); color: white; border-radius: 3px; padding: 5px;")
-        self.clear_btn.clicked.connect(self.clear_timeline)
+        self.clear_btn.setObjectName("clearButton")
         
         button_layout.addWidget(self.export_btn)
         button_layout.addWidget(self.clear_btn)
@@ -806,18 +1188,7 @@ class OverlayWidget(QWidget):
         
         # Add visible resize grip
         size_grip = QSizeGrip(self)
-        size_grip.setStyleSheet("""
-            QSizeGrip {
-                background-color: rgba(0, 255, 0, 100);
-                border: 1px solid rgba(0, 255, 0, 150);
-                border-radius: 3px;
-                width: 16px;
-                height: 16px;
-            }
-            QSizeGrip:hover {
-                background-color: rgba(0, 255, 0, 150);
-            }
-        """)
+        size_grip.setObjectName("sizeGrip")
         grip_layout = QHBoxLayout()
         grip_layout.addStretch()
         grip_layout.addWidget(size_grip)
@@ -825,14 +1196,14 @@ class OverlayWidget(QWidget):
         
         self.setLayout(layout)
         
+        # Wire on_<objectName>_<signal> slots for the buttons (see the pyqtSlot names)
+        QMetaObject.connectSlotsByName(self)
+        
         # Apply window opacity and styles
         self.setWindowOpacity(self.settings['opacity'])
         self.drag_position = QPoint()
         self.dragging = False
         self.update_styles()
-        
-        # Set global dark theme for context menus
-        self.setStyleSheet(self.get_global_dark_theme())
     
     
     def restore_window_position(self):
@@ -843,7 +1214,7 @@ class OverlayWidget(QWidget):
             print(f"Restoring window position to ({x}, {y})")
             
             # Try to restore position after window is shown
-            QTimer.singleShot(100, lambda: self.move(x, y))
+            QTimer.singleShot(100, partial(self.move, x, y))
         else:
             print("No saved position to restore")
     
@@ -853,83 +1224,61 @@ class OverlayWidget(QWidget):
         self.settings['window_x'] = pos.x()
         self.settings['window_y'] = pos.y()
         print(f"Saving window position: ({pos.x()}, {pos.y()})")
-        self.save_settings()
+        self.schedule_save()
     
     def moveEvent(self, event):
         """Called when window is moved - save position"""
         super().moveEvent(event)
         # Save position when window moves (with small delay to avoid spam)
-        if hasattr(self, '_move_timer'):
-            self._move_timer.stop()
-        
-        self._move_timer = QTimer()
-        self._move_timer.setSingleShot(True)
-        self._move_timer.timeout.connect(self.save_window_position)
         self._move_timer.start(1000)  # Save after 1 second of no movement
     
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
         if event.key() == Qt.Key.Key_Space:
-            self.toggle_microphone()
+            # Holding Space must not flip the microphone on and off repeatedly
+            if not event.isAutoRepeat():
+                self.toggle_microphone()
             event.accept()
         else:
             super().keyPressEvent(event)
     
+    def eventFilter(self, obj, event):
+        """Submit the question on a bare Return; every other key goes to the editor"""
+        if (obj is self.question_input and event.type() == QEvent.Type.KeyPress
+                and event.key() == Qt.Key.Key_Return and not event.modifiers()):
+            self.ask_question()
+            return True
+        return super().eventFilter(obj, event)
+    
+    @pyqtSlot(name="on_micToggleButton_clicked")
     def toggle_microphone(self):
         """Toggle microphone on/off"""
         try:
-            # Check if currently enabled by looking at audio listener state
-            currently_enabled = self.audio_listener is not None and hasattr(self, 'mic_enabled') and self.mic_enabled
-            
-            if currently_enabled:
+            if self.mic_enabled:
                 # Turn off microphone
                 self.mic_enabled = False
-                if self.audio_listener:
-                    self.audio_listener.stop()
-                    self.audio_listener.wait()
-                    self.audio_listener = None
+                if self.audio_listener is not None:
+                    self._retire_audio_listener()
                 
                 # Update button appearance
                 self.mic_toggle_btn.setText("🔇")
-                self.mic_toggle_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: rgba(255, 0, 0, 150);
-                        color: white;
-                        border-radius: 10px;
-                        font-weight: bold;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(255, 0, 0, 200);
-                    }
-                """)
+                set_style_state(self.mic_toggle_btn, "off")
                 self.mic_toggle_btn.setToolTip("Turn On Microphone (Space)")
                 
                 # Update UI
-                if hasattr(self, 'ui_updater'):
-                    self.ui_updater.request_update("update_whisper_status", status="disabled")
-                    self.ui_updater.request_update("display_transcription", text="Microphone disabled")
+                self.update_whisper_status("disabled")
+                self.ui_updater.request_update("display_transcription", text="Microphone disabled")
                 
                 print("Microphone turned OFF")
             else:
-                # Turn on microphone
+                # Turn on microphone (or once a listener that is still stopping has finished)
                 self.mic_enabled = True
-                self.init_audio()
+                if not self._stopping_listeners:
+                    self.init_audio()
                 
                 # Update button appearance
                 self.mic_toggle_btn.setText("🎤")
-                self.mic_toggle_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: rgba(0, 255, 0, 150);
-                        color: white;
-                        border-radius: 10px;
-                        font-weight: bold;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(0, 255, 0, 200);
-                    }
-                """)
+                set_style_state(self.mic_toggle_btn, "on")
                 self.mic_toggle_btn.setToolTip("Turn Off Microphone (Space)")
                 
                 print("Microphone turned ON")
@@ -937,8 +1286,11 @@ class OverlayWidget(QWidget):
         except Exception as e:
             print(f"Error toggling microphone: {e}")
     
+    @pyqtSlot(name="on_askButton_clicked")
     def ask_question(self):
         """Process question from input area"""
+        if self.question_input.document().isEmpty():
+            return
         question_text = self.question_input.toPlainText().strip()
         if not question_text:
             return
@@ -949,15 +1301,12 @@ class OverlayWidget(QWidget):
         self.question_input.clear()
         
         # Send to Claude processing
-        if hasattr(self, 'ui_updater') and self.ui_updater:
-            self.ui_updater.request_update("claude_processing", text=question_text)
+        self.ui_updater.request_update("claude_processing", text=question_text)
     
+    @pyqtSlot(name="on_audioInfoButton_clicked")
     def show_system_audio_info(self):
         """Show information about available system audio capture options"""
         try:
-            from PyQt6.QtWidgets import QMessageBox
-            from .audio import FastAudioListener
-            
             system_devices = FastAudioListener.get_system_audio_info()
             
             if not system_devices:
@@ -992,19 +1341,12 @@ To capture system audio, you may need to:
             
         except Exception as e:
             print(f"Error showing system audio info: {e}")
-            if hasattr(self, 'current_response'):
-                self.current_response.setText(f"Error: {str(e)}")
+            self.current_response.setPlainText(f"Error: {str(e)}")
     
     def create_title_bar(self):
         """Create the title bar with controls"""
         title_frame = DraggableFrame(self)
-        title_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(40, 40, 40, 180);
-                border-radius: 6px;
-                border: 1px solid rgba(120, 120, 120, 100);
-            }
-        """)
+        title_frame.setObjectName("titleBar")
         title_frame.setFixedHeight(35)
         
         title_layout = QHBoxLayout(title_frame)
@@ -1012,29 +1354,13 @@ To capture system audio, you may need to:
         
         # Title (drag area)
         title_label = QLabel("SAI - Smart AI Assistant")
-        title_label.setStyleSheet("color: white; font-weight: bold; font-size: 11px;")
+        title_label.setObjectName("titleLabel")
         title_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         title_layout.addWidget(title_label)
         
         # Audio source selector (includes system audio)
         self.mic_selector = QComboBox()
-        self.mic_selector.setStyleSheet("""
-            QComboBox {
-                background-color: rgba(60, 60, 60, 180);
-                color: white;
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 3px;
-                padding: 2px 5px;
-                min-width: 150px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                color: white;
-            }
-        """)
+        self.mic_selector.setObjectName("micSelector")
         self.mic_selector.currentIndexChanged.connect(self.on_microphone_changed)
         title_layout.addWidget(self.mic_selector)
         
@@ -1043,187 +1369,147 @@ To capture system audio, you may need to:
         
         # System audio info button
         audio_info_btn = QPushButton("🔊")
-        audio_info_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 200, 255, 150);
-                color: white;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 220, 255, 200);
-            }
-        """)
+        audio_info_btn.setObjectName("audioInfoButton")
         audio_info_btn.setFixedSize(16, 20)
         audio_info_btn.setToolTip("Show System Audio Info")
-        audio_info_btn.clicked.connect(self.show_system_audio_info)
         title_layout.addWidget(audio_info_btn)
         
         title_layout.addStretch()
         
         # Mic toggle button
         self.mic_toggle_btn = QPushButton("🎤")
-        self.mic_toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 255, 0, 150);
-                color: white;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 255, 0, 200);
-            }
-        """)
+        self.mic_toggle_btn.setObjectName("micToggleButton")
         self.mic_toggle_btn.setFixedSize(25, 20)
         self.mic_toggle_btn.setToolTip("Toggle Microphone (Space)")
-        self.mic_toggle_btn.clicked.connect(self.toggle_microphone)
         title_layout.addWidget(self.mic_toggle_btn)
         
         # Config button
         config_btn = QPushButton("⚙")
-        config_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(100, 150, 255, 150);
-                color: white;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(120, 170, 255, 200);
-            }
-        """)
+        config_btn.setObjectName("configButton")
         config_btn.setFixedSize(20, 20)
         config_btn.setToolTip("Settings")
-        config_btn.clicked.connect(self.show_config_dialog)
         title_layout.addWidget(config_btn)
         
         # Hide button
         hide_btn = QPushButton("−")
-        hide_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 200, 0, 150);
-                color: black;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 220, 0, 200);
-            }
-        """)
+        hide_btn.setObjectName("hideButton")
         hide_btn.setFixedSize(20, 20)
         hide_btn.setToolTip("Hide to Tray")
-        hide_btn.clicked.connect(self.hide_to_tray)
         title_layout.addWidget(hide_btn)
         
         # Close button
         close_btn = QPushButton("×")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 100, 100, 150);
-                color: white;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 120, 120, 200);
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.setFixedSize(20, 20)
         close_btn.setToolTip("Close")
-        close_btn.clicked.connect(self.quit_application)
         title_layout.addWidget(close_btn)
         
         return title_frame
     
     def populate_microphone_list(self):
         """Populate the microphone selector with saved device restoration"""
+        # Programmatic changes while filling the list must not trigger a listener restart
+        blocker = QSignalBlocker(self.mic_selector)
+        self.mic_selector.setUpdatesEnabled(False)
         try:
             self.mic_selector.clear()
             microphones = AudioListener.get_microphone_list()
             
             saved_device_index = self.settings.get('microphone_device_index')
             saved_device_name = self.settings.get('microphone_device_name', '')
-            selected_index = 0  # Default to first item
+            font_metrics = QFontMetrics(self.mic_selector.font())
             
             for i, (index, name) in enumerate(microphones):
-                display_name = name[:50] + "..." if len(name) > 50 else name
+                display_name = font_metrics.elidedText(name, Qt.TextElideMode.ElideRight, 300)
                 self.mic_selector.addItem(display_name, index)
-                
-                # Try to restore saved device by index first, then by name
-                if saved_device_index is not None and index == saved_device_index:
-                    selected_index = i
-                elif saved_device_name and saved_device_name in name:
-                    selected_index = i
+                self.mic_selector.setItemData(i, name, Qt.ItemDataRole.ToolTipRole)
+            
+            # Restore the saved device by index, falling back to a name match, then the first item
+            rows_by_device = {index: i for i, (index, _) in enumerate(microphones)}
+            selected_index = rows_by_device.get(saved_device_index)
+            if selected_index is None:
+                selected_index = next(
+                    (i for i, (_, name) in enumerate(microphones)
+                     if saved_device_name and saved_device_name in name),
+                    0
+                )
             
             if len(microphones) > 0:
                 self.mic_selector.setCurrentIndex(selected_index)
-                print(f"Restored microphone: {microphones[selected_index][1]}")
+                device_index, device_name = microphones[selected_index]
+                # Signals are blocked, so sync settings here: init_audio opens the row shown
+                if (device_index, device_name) != (saved_device_index, saved_device_name):
+                    self.settings['microphone_device_index'] = device_index
+                    self.settings['microphone_device_name'] = device_name
+                    self.schedule_save()
+                self._current_device_index = device_index
+                print(f"Restored microphone: {device_name}")
             
         except Exception as e:
             print(f"Error populating microphone list: {e}")
             self.mic_selector.addItem("Default Microphone", None)
+        finally:
+            self.mic_selector.setUpdatesEnabled(True)
+            blocker.unblock()
     
     def on_microphone_changed(self, index):
         """Handle microphone selection change and save selection"""
         try:
             device_index = self.mic_selector.itemData(index)
-            mic_name = self.mic_selector.currentText()
+            if self.audio_listener and device_index == self._current_device_index:
+                return
+            mic_name = self.mic_selector.itemData(index, Qt.ItemDataRole.ToolTipRole) or self.mic_selector.currentText()
             
             # Save the selected device to settings
             self.settings['microphone_device_index'] = device_index
             self.settings['microphone_device_name'] = mic_name
-            self.save_settings()
+            self.schedule_save()
             
             if self.audio_listener:
-                self.audio_listener.stop()
-                self.audio_listener.wait()
-                
-                # Stop transcription check timer if it exists
-                if hasattr(self, 'transcription_check_timer'):
-                    self.transcription_check_timer.stop()
-                
-                # Start new listener with selected microphone
-                if FAST_AUDIO_AVAILABLE and self.settings.get('use_fast_mode', True):
-                    self.audio_listener = FastAudioListener(device_index)
-                    print(f"Device changed: Using FastAudioListener with device {device_index}")
-                    
-                    # Reconnect ALL signals for FastAudioListener
-                    if hasattr(self.audio_listener, 'whisper_status_changed'):
-                        self.audio_listener.whisper_status_changed.connect(self.update_whisper_status)
-                        print("Connected whisper_status_changed signal")
-                    
-                    if hasattr(self.audio_listener, 'claude_ready'):
-                        self.audio_listener.claude_ready.connect(self.handle_claude_request)
-                        print("Connected claude_ready signal")
-                    
-                    # Restart transcription check timer for instant display
-                    self.transcription_check_timer = QTimer()
-                    self.transcription_check_timer.timeout.connect(self._check_transcription_results)
-                    self.transcription_check_timer.start(50)
-                    print("Restarted transcription check timer")
-                    
-                else:
-                    self.audio_listener = AudioListener(device_index)
-                    print(f"Device changed: Using AudioListener with device {device_index}")
-                    
-                # Connect transcription signal for both types
-                self.audio_listener.transcription_ready.connect(self.display_transcription)
-                print("Connected transcription_ready signal")
-                
-                self.audio_listener.start()
-                print("Audio listener restarted successfully")
+                # The new listener starts on the saved device once the old one has stopped
+                self._retire_audio_listener()
                 
-                self.current_response.setText(f"Switched to: {mic_name}")
+                self.current_response.setPlainText(f"Switched to: {mic_name}")
                 print(f"Microphone saved: {mic_name} (index: {device_index})")
         except Exception as e:
-            self.current_response.setText(f"Error switching microphone: {str(e)}")
+            self.current_response.setPlainText(f"Error switching microphone: {str(e)}")
             print(f"Error in microphone change: {e}")
     
+    def _retire_audio_listener(self):
+        """Stop the current listener without blocking the UI thread
+        
+        The listener is kept referenced until its thread finishes; audio then restarts
+        from the saved settings if the microphone is (still) enabled.
+        """
+        listener = self.audio_listener
+        self.audio_listener = None
+        
+        # Results the stopping thread still delivers must not reach the UI or Claude
+        try:
+            listener.transcription_ready.disconnect(self.display_transcription)
+            if isinstance(listener, FastAudioListener):
+                listener.whisper_status_changed.disconnect(self.update_whisper_status)
+                listener.claude_ready.disconnect(self.handle_claude_request)
+        except TypeError:
+            pass  # init_audio failed before connecting
+        
+        self._stopping_listeners.add(listener)
+        listener.finished.connect(partial(self._on_listener_finished, listener))
+        listener.stop()
+        if listener.isFinished() or not listener.isRunning():
+            # run() already returned (no device, errors, should_run off), so finished
+            # will not fire again; connected first so an exit in between is not missed
+            self._on_listener_finished(listener)
+    
+    def _on_listener_finished(self, listener):
+        """Release a stopped listener and start its replacement (once per listener)"""
+        if listener not in self._stopping_listeners:
+            return
+        self._stopping_listeners.discard(listener)
+        listener.deleteLater()
+        if self.mic_enabled and self.audio_listener is None and not self._stopping_listeners:
+            self.init_audio()
+    
     def init_claude_client(self):
         """Initialize Claude API client"""
         try:
@@ -1232,7 +1518,7 @@ To capture system audio, you may need to:
             print("Claude client initialized")
         except Exception as e:
             print(f"Failed to initialize Claude client: {e}")
-            self.current_response.setText(f"Claude API Error: {e}")
+            self.current_response.setPlainText(f"Claude API Error: {e}")
     
     def init_audio(self):
         """Initialize audio listening with saved device"""
@@ -1240,21 +1526,15 @@ To capture system audio, you may need to:
             # Get saved microphone device
             saved_device_index = self.settings.get('microphone_device_index')
             saved_device_name = self.settings.get('microphone_device_name', '')
+            self._current_device_index = saved_device_index
             
             if self.settings.get('use_fast_mode', True) and FAST_AUDIO_AVAILABLE:
                 self.audio_listener = FastAudioListener(saved_device_index)
                 print(f"Using fast audio processing with Whisper + VAD")
                 if saved_device_name:
                     print(f"Using saved microphone: {saved_device_name}")
-                if hasattr(self.audio_listener, 'whisper_status_changed'):
-                    self.audio_listener.whisper_status_changed.connect(self.update_whisper_status)
-                if hasattr(self.audio_listener, 'claude_ready'):
-                    self.audio_listener.claude_ready.connect(self.handle_claude_request)
-                
-                # Set up timer to check for transcription results from worker threads
-                self.transcription_check_timer = QTimer()
-                self.transcription_check_timer.timeout.connect(self._check_transcription_results)
-                self.transcription_check_timer.start(50)  # Check every 50ms for instant display
+                self.audio_listener.whisper_status_changed.connect(self.update_whisper_status)
+                self.audio_listener.claude_ready.connect(self.handle_claude_request)
                 
             else:
                 self.audio_listener = AudioListener(saved_device_index)
@@ -1267,128 +1547,85 @@ To capture system audio, you may need to:
             self.audio_listener.start()
         except Exception as e:
             print(f"Failed to initialize audio processing: {e}")
-            self.current_response.setText(f"Audio Error: {e}")
-    
-    def _check_transcription_results(self):
-        """Check for transcription results from worker threads (runs in main thread)"""
-        if hasattr(self.audio_listener, 'check_transcription_results'):
-            self.audio_listener.check_transcription_results()
-    
-    def handle_transcription(self, text: str):
-        """Handle new transcription from audio listener (thread-safe)"""
-        # Use QTimer to ensure this runs in main thread
-        def _handle_in_main_thread():
-            if not self.mic_enabled or not self.claude_client:
-                return
-            
-            # Show transcribed text
-            if hasattr(self, 'transcription_area') and self.transcription_area:
-                self.transcription_area.setText(text)
+            self.current_response.setPlainText(f"Audio Error: {e}")
+    
+    def _on_ai_response(self, text, ai_response, timestamp, texts):
+        """Record and show an AI response for a transcription (main thread)"""
+        try:
+            self.update_ai_status("responding")
             
-            # Show AI status
-            self.update_ai_status("thinking")
-            self.current_response.setText("🤔 Processing...")
+            entry = self.record_exchange(text, ai_response, timestamp)
             
-            # Get context from recent conversation
-            context = ""
-            if len(self.conversation_history) > 0:
-                recent_entries = self.conversation_history[-2:]
-                context = " ".join([f"{entry.transcription}" for entry in recent_entries])
-                if len(context) > 200:
-                    context = context[-200:]
+            # Update UI
+            self.ui_updater.request_update("set_response", text=ai_response)
+            self.add_timeline_entry(entry, texts)
             
-            # Async callback for AI response
-            def on_ai_response(ai_response: str):
-                def _handle_ai_response():
-                    try:
-                        self.update_ai_status("responding")
-                        
-                        # Create conversation entry
-                        entry = ConversationEntry(datetime.now(), text, ai_response)
-                        self.conversation_history.append(entry)
-                        
-                        # Update UI
-                        self.current_response.setText(ai_response)
-                        self.add_timeline_entry(entry)
-                        
-                        # Keep only last 100 entries
-                        if len(self.conversation_history) > 100:
-                            self.conversation_history = self.conversation_history[-100:]
-                        
-                        # Set AI back to idle after a brief delay
-                        QTimer.singleShot(2000, lambda: self.update_ai_status("idle"))
-                            
-                    except Exception as e:
-                        print(f"Error handling AI response: {e}")
-                        self.current_response.setText(f"Error: {str(e)}")
-                        self.update_ai_status("error")
+            # Set AI back to idle after a brief delay
+            self.ui_updater.request_update("schedule_ai_idle")
                 
-                # Ensure AI response handling is also in main thread
-                QTimer.singleShot(0, _handle_ai_response)
-            
-            # Get AI response asynchronously
-            self.claude_client.get_response_async(
-                text, 
-                context, 
-                self.settings.get('custom_prompt', ''),
-                self.settings.get('mode', 'default'),
-                callback=on_ai_response
-            )
-        
-        # Ensure this entire method runs in the main thread
-        QTimer.singleShot(0, _handle_in_main_thread)
+        except Exception as e:
+            print(f"Error handling AI response: {e}")
+            self.ui_updater.request_update("set_response", text=f"Error: {str(e)}")
+            self.update_ai_status("error")
     
     def display_transcription(self, text: str):
         """Display transcription instantly (thread-safe)"""
         self.ui_updater.request_update("display_transcription", text=text)
     
+    def is_repeat_transcription(self, text: str) -> bool:
+        """True if text (case/whitespace-normalized) nearly repeats a transcription from the last DUPLICATE_WINDOW seconds"""
+        norm = " ".join(text.lower().split())
+        now = time.monotonic()
+        if now - self._last_transcription_time <= self.DUPLICATE_WINDOW:
+            last = self._last_transcription_norm
+            if norm == last:
+                return True
+            
+            # quick_ratio() is a cheap upper bound; only compute the real ratio when it could pass
+            matcher = SequenceMatcher(None, norm, last)
+            if matcher.quick_ratio() > self.DUPLICATE_RATIO and matcher.ratio() > self.DUPLICATE_RATIO:
+                return True
+        
+        self._last_transcription_norm = norm
+        self._last_transcription_time = now
+        return False
+    
     def handle_claude_request(self, text: str):
         """Handle Claude processing request (thread-safe)"""
         print(f"handle_claude_request called with text: '{text}'")
+        if self.is_repeat_transcription(text):
+            print("Skipping repeated transcription")
+            return
         self.ui_updater.request_update("claude_processing", text=text)
     
-    def add_timeline_entry(self, entry: ConversationEntry):
-        """Add an entry to the timeline"""
-        entry_widget = QFrame()
-        entry_widget.setStyleSheet("""
-            QFrame {
-                background-color: rgba(60, 60, 60, 100);
-                border: 1px solid rgba(100, 100, 100, 80);
-                border-radius: 5px;
-                margin: 2px;
-                padding: 5px;
-            }
-        """)
-        
-        entry_layout = QVBoxLayout(entry_widget)
-        
-        # Timestamp
-        timestamp_label = QLabel(entry.timestamp.strftime("%H:%M:%S"))
-        timestamp_label.setStyleSheet("color: #aaa; font-size: 10px;")
-        entry_layout.addWidget(timestamp_label)
-        
-        # Transcription
-        transcription_label = QLabel(f"You: {entry.transcription}")
-        transcription_label.setStyleSheet("color: white; font-weight: bold;")
-        transcription_label.setWordWrap(True)
-        entry_layout.addWidget(transcription_label)
-        
-        # AI Response
-        response_label = QLabel(f"AI: {entry.ai_response}")
-        response_label.setStyleSheet("color: #88ff88;")
-        response_label.setWordWrap(True)
-        entry_layout.addWidget(response_label)
-        
-        # Add to timeline
-        self.timeline_layout.addWidget(entry_widget)
-        
-        # Auto-scroll to bottom
-        QTimer.singleShot(100, lambda: self.timeline_scroll.verticalScrollBar().setValue(
-            self.timeline_scroll.verticalScrollBar().maximum()
-        ))
+    def add_timeline_entry(self, entry: ConversationEntry, texts=None):
+        """Add an entry to the timeline (texts: its display lines, if already formatted)"""
+        # Auto-scrolls once the new row is laid out if the view was at the bottom
+        self.timeline_model.add_entry(entry, texts)
+    
+    def repopulate_timeline(self, entries):
+        """Replace the timeline contents in one pass and follow the newest entry"""
+        self._follow_timeline = True
+        self.timeline_view.setUpdatesEnabled(False)
+        try:
+            self.timeline_model.set_entries(entries)
+        finally:
+            self.timeline_view.setUpdatesEnabled(True)
+    
+    def _on_timeline_range_changed(self, minimum, maximum):
+        """Stay at the bottom as rows are laid out, unless the user scrolled up"""
+        if self._follow_timeline:
+            self.timeline_view.verticalScrollBar().setValue(maximum)
+    
+    def _on_timeline_scrolled(self, value):
+        """Follow new entries only while the view is at the bottom"""
+        self._follow_timeline = value >= self.timeline_view.verticalScrollBar().maximum()
     
     def update_whisper_status(self, status):
-        """Update Whisper processing status indicator (thread-safe)"""
+        """Update Whisper processing status indicator (main thread; repeats are dropped)"""
+        if status == self._whisper_status:
+            return
+        self._whisper_status = status
         self.ui_updater.request_update("update_whisper_status", status=status)
     
     def update_ai_status(self, status):
@@ -1396,51 +1633,18 @@ To capture system audio, you may need to:
         self.ui_updater.request_update("update_ai_status", status=status)
     
     def get_global_dark_theme(self):
-        """Get global dark theme including context menus"""
-        font_size = self.settings['font_size']
-        return f"""
-            QWidget {{
-                color: white;
-                font-family: 'Arial', sans-serif;
-                font-size: {font_size}px;
-                background-color: transparent;
-            }}
-            QLabel {{
-                color: white;
-                font-size: {font_size}px;
-            }}
-            /* Context menu styling */
-            QMenu {{
-                background-color: rgba(20, 20, 20, 240);
-                color: #00ff00;
-                border: 1px solid rgba(0, 255, 0, 150);
-                border-radius: 5px;
-                padding: 5px;
-                font-family: 'Courier New', monospace;
-            }}
-            QMenu::item {{
-                background-color: transparent;
-                padding: 5px 10px;
-                border-radius: 3px;
-            }}
-            QMenu::item:selected {{
-                background-color: rgba(0, 255, 0, 50);
-                color: #00ff00;
-            }}
-            QMenu::item:pressed {{
-                background-color: rgba(0, 255, 0, 100);
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: rgba(0, 255, 0, 100);
-                margin: 5px;
-            }}
-        """
+        """Get the application stylesheet (overlay widgets plus the settings dialog)"""
+        return build_app_stylesheet(self.settings['font_size'])
     
     def update_styles(self):
-        """Update UI styles with current settings"""
-        self.setStyleSheet(self.get_global_dark_theme())
+        """Update UI styles with current settings (only rebuilt when the font size changes)"""
+        font_size = self.settings['font_size']
+        if font_size == self._styled_font_size:
+            return
+        self._styled_font_size = font_size
+        QApplication.instance().setStyleSheet(self.get_global_dark_theme())
     
+    @pyqtSlot(name="on_exportButton_clicked")
     def export_data(self):
         """Export conversation data to JSON file"""
         try:
@@ -1453,80 +1657,75 @@ To capture system audio, you may need to:
                 'settings': self.settings
             }
             
-            with open(export_file, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Exports are meant to be read, so unlike the history and settings files they stay indented
+            storage.write_json(export_file, export_data, indent=True)
             
-            self.current_response.setText(f"Data exported to: {export_file}")
+            self.current_response.setPlainText(f"Data exported to: {export_file}")
         except Exception as e:
-            self.current_response.setText(f"Export error: {str(e)}")
+            self.current_response.setPlainText(f"Export error: {str(e)}")
     
+    @pyqtSlot(name="on_clearButton_clicked")
     def clear_timeline(self):
         """Clear the timeline and conversation history"""
-        self.conversation_history = []
+        self._history_generation += 1  # A history load still in flight must not restore entries
+        self.conversation_history.clear()
+        self._recent_context = ""
+        self._last_transcription_norm = ""  # Saying the last thing again after a clear is not a repeat
         
-        # Clear timeline UI
-        for i in reversed(range(self.timeline_layout.count())):
-            child = self.timeline_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
+        # Clear timeline UI (a single model reset, not per-row removal)
+        self.timeline_model.clear()
         
-        self.current_response.setText("Timeline cleared")
-        self.save_conversation_history()
+        self.current_response.setPlainText("Timeline cleared")
+        self._history_log_lines = 0
+        self._io_pool.start(partial(self._write_history, []))
     
+    @pyqtSlot(name="on_configButton_clicked")
     def show_config_dialog(self):
         """Show configuration dialog"""
         dialog = ConfigDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Update all settings from dialog
-            self.settings['font_size'] = dialog.font_slider.value()
-            self.settings['opacity'] = dialog.opacity_slider.value() / 100.0
-            self.settings['window_width'] = dialog.width_spin.value()
-            self.settings['window_height'] = dialog.height_spin.value()
-            self.settings['show_transcription'] = dialog.show_transcription_cb.isChecked()
-            self.settings['mode'] = dialog.mode_combo.currentText()
-            self.settings['custom_prompt'] = dialog.custom_prompt_edit.toPlainText()
-            self.settings['use_fast_mode'] = dialog.fast_mode_cb.isChecked()
-            
+            # The dialog has written its values into self.settings
             # Apply changes immediately
             self.setWindowOpacity(self.settings['opacity'])
             self.resize(self.settings['window_width'], self.settings['window_height'])
             self.update_styles()
             
             # Update transcription area visibility
-            if hasattr(self, 'transcription_area'):
-                self.transcription_area.setVisible(self.settings['show_transcription'])
+            self.transcription_area.setVisible(self.settings['show_transcription'])
             
             # Restart audio if mode changed
-            if hasattr(self, 'audio_listener') and self.audio_listener:
-                old_mode = getattr(self, '_current_audio_mode', True)
+            if self.audio_listener:
+                old_mode = self._current_audio_mode
                 new_mode = self.settings['use_fast_mode']
                 if old_mode != new_mode:
                     self.restart_audio_listener()
                 self._current_audio_mode = new_mode
             
-            self.save_settings()
-            self.current_response.setText("Settings updated and applied")
+            self.schedule_save()
+            self.current_response.setPlainText("Settings updated and applied")
     
     def restart_audio_listener(self):
         """Restart audio listener with new settings"""
         try:
+            # Reinitialize audio with new settings once the old listener has stopped
             if self.audio_listener:
-                self.audio_listener.stop()
-                self.audio_listener.wait()
-            
-            # Reinitialize audio with new settings
-            self.init_audio()
+                self._retire_audio_listener()
+            elif not self._stopping_listeners:
+                self.init_audio()
         except Exception as e:
             print(f"Error restarting audio listener: {e}")
-            self.current_response.setText(f"Audio restart error: {str(e)}")
+            self.current_response.setPlainText(f"Audio restart error: {str(e)}")
     
     
     def closeEvent(self, event):
         """Handle close event"""
+        self.mic_enabled = False  # No restarts from listeners finishing below
         if self.audio_listener:
             self.audio_listener.stop()
             self.audio_listener.wait()
+        for listener in tuple(self._stopping_listeners):
+            listener.wait()
         
-        self.save_settings()
-        self.save_conversation_history()
+        self.flush_now()
+        self.compact_conversation_history()
         event.accept()
\ No newline at end of file
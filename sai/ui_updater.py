@@ -2,10 +2,34 @@
 Dedicated UI updater thread - handles ALL UI operations to avoid Qt threading issues
 """
 
-import queue
 import threading
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from collections import deque
+from functools import partial
+from types import MappingProxyType
 from datetime import datetime
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QTimer
+
+from .timeline import format_lines
+
+def set_style_state(widget, state):
+    """Switch a widget's QSS state property and re-polish it"""
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+# Status label (text, tooltip) per indicator state
+WHISPER_STATES = MappingProxyType({
+    "listening": ("🎤", "Listening for speech..."),
+    "processing": ("🎵", "Processing speech..."),
+    "idle": ("🎤", "Speech recognition idle"),
+    "disabled": ("🚫", "Microphone disabled"),
+})
+AI_STATES = MappingProxyType({
+    "thinking": ("🤔", "AI thinking..."),
+    "responding": ("💬", "AI responding..."),
+    "idle": ("🤖", "AI idle"),
+    "error": ("⚠️", "AI error"),
+})
 
 class UIUpdateRequest:
     """Represents a UI update request"""
@@ -16,158 +40,152 @@ class UIUpdateRequest:
 class UIUpdater(QObject):
     """Thread-safe UI updater that handles all UI operations"""
     
+    # Actions that replace a widget's whole text or state; only the newest one per drain is applied
+    COALESCED_ACTIONS = frozenset((
+        "display_transcription", "set_response", "update_whisper_status", "update_ai_status",
+    ))
+    AI_IDLE_DELAY = 2000  # ms the AI indicator keeps its last state after a response
+    
+    # Emitted (from any thread) when the queue goes from drained to non-empty
+    update_requested = pyqtSignal()
+    
     def __init__(self, overlay_widget):
         super().__init__()
         self.overlay_widget = overlay_widget
-        self.update_queue = queue.Queue()
         
-        # Timer to process UI updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.process_updates)
-        self.update_timer.start(16)  # ~60fps updates
+        # Widgets this updater writes to; created by the overlay's init_ui before the updater
+        self.transcription_area = overlay_widget.transcription_area
+        self.current_response = overlay_widget.current_response
+        self.whisper_status = overlay_widget.whisper_status
+        self.ai_status = overlay_widget.ai_status
+        
+        self.update_queue = deque()  # append/popleft are atomic; one consumer (main thread)
+        
+        # Last applied indicator states, so repeats are no-ops
+        self._last_whisper_status = None
+        self._last_ai_status = None
+        
+        # One reusable timer returns the AI indicator to idle; any newer status cancels it
+        self._ai_idle_timer = QTimer(self)
+        self._ai_idle_timer.setSingleShot(True)
+        self._ai_idle_timer.timeout.connect(partial(self.request_update, "update_ai_status", status="idle"))
+        
+        # Request action -> handler, called with the request's keyword arguments
+        self._dispatch = {
+            "display_transcription": self._set_transcription,
+            "update_whisper_status": self._update_whisper_status,
+            "update_ai_status": self._update_ai_status,
+            "set_response": self._set_response,
+            "add_timeline_entry": self._add_timeline_entry,
+            "schedule_ai_idle": self._schedule_ai_idle,
+            "claude_processing": self._handle_claude_processing,
+        }
+        
+        # The main thread drains the queue only when something was queued; requests
+        # arriving before the drain runs are handled in the same pass
+        self._drain_scheduled = False
+        self.update_requested.connect(self.process_updates, Qt.ConnectionType.QueuedConnection)
+        
+        # Text/status requests held while the overlay is hidden: action -> newest request
+        self._deferred = {}
         
     def request_update(self, action, **kwargs):
         """Thread-safe method to request UI update"""
-        self.update_queue.put(UIUpdateRequest(action, **kwargs))
+        self.update_queue.append(UIUpdateRequest(action, **kwargs))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.update_requested.emit()
     
     def process_updates(self):
         """Process all pending UI updates (runs in main thread)"""
+        # Cleared before draining: anything queued after this point schedules another pass
+        self._drain_scheduled = False
         try:
-            while True:
-                try:
-                    request = self.update_queue.get_nowait()
-                    self._handle_update(request)
-                except queue.Empty:
-                    break
+            queued = self.update_queue
+            requests = [queued.popleft() for _ in range(len(queued))]
+            if not requests:
+                return
+            
+            # Streamed chunks, fast speech and status flips queue several replacements
+            # per drain; earlier ones would be overwritten before the next paint
+            latest = {
+                request.action: i for i, request in enumerate(requests)
+                if request.action in self.COALESCED_ACTIONS
+            }
+            # While the overlay is hidden, text and status changes are held (newest per
+            # action) and applied when it is shown again; other actions run as usual
+            visible = self.overlay_widget.isVisible()
+            for i, request in enumerate(requests):
+                if latest.get(request.action, i) != i:
+                    continue
+                if not visible and request.action in self.COALESCED_ACTIONS:
+                    if request.action == "update_ai_status":
+                        self._ai_idle_timer.stop()  # As if applied: a newer status cancels the reset
+                    self._deferred[request.action] = request
+                    continue
+                self._handle_update(request)
         except Exception as e:
             print(f"UI update error: {e}")
     
+    def flush_deferred(self):
+        """Apply the text/status updates held back while the overlay was hidden"""
+        deferred = self._deferred
+        self._deferred = {}
+        for request in deferred.values():
+            self._handle_update(request)
+    
     def _handle_update(self, request):
         """Handle individual UI update request"""
+        handler = self._dispatch.get(request.action)
+        if handler is None:
+            return
         try:
-            if request.action == "display_transcription":
-                text = request.kwargs.get('text', '')
-                if hasattr(self.overlay_widget, 'transcription_area'):
-                    self.overlay_widget.transcription_area.setText(text)
-                    
-            elif request.action == "update_whisper_status":
-                status = request.kwargs.get('status', 'idle')
-                self._update_whisper_status(status)
-                
-            elif request.action == "update_ai_status":
-                status = request.kwargs.get('status', 'idle')
-                self._update_ai_status(status)
-                
-            elif request.action == "set_response":
-                text = request.kwargs.get('text', '')
-                if hasattr(self.overlay_widget, 'current_response'):
-                    self.overlay_widget.current_response.setText(text)
-                    
-            elif request.action == "add_timeline_entry":
-                entry = request.kwargs.get('entry')
-                if entry:
-                    self._add_timeline_entry(entry)
-                    
-            elif request.action == "claude_processing":
-                text = request.kwargs.get('text', '')
-                self._handle_claude_processing(text)
-                
+            handler(**request.kwargs)
         except Exception as e:
             print(f"Error handling UI update {request.action}: {e}")
     
-    def _update_whisper_status(self, status):
+    def _set_transcription(self, text=''):
+        """Show the latest transcription"""
+        self.transcription_area.setPlainText(text)
+    
+    def _set_response(self, text=''):
+        """Show the current (possibly partial) AI response"""
+        self.current_response.setPlainText(text)
+    
+    def _schedule_ai_idle(self):
+        """Return the AI indicator to idle after AI_IDLE_DELAY unless a newer status arrives"""
+        self._ai_idle_timer.start(self.AI_IDLE_DELAY)
+    
+    def _update_whisper_status(self, status='idle'):
         """Update Whisper status indicator"""
-        if not hasattr(self.overlay_widget, 'whisper_status'):
+        if status == self._last_whisper_status:
             return
-            
-        widget = self.overlay_widget.whisper_status
-        
-        if status == "listening":
-            widget.setText("🎤")
-            widget.setStyleSheet("color: #00ff00; font-size: 16px;")
-            widget.setToolTip("Listening for speech...")
-        elif status == "processing":
-            widget.setText("🎵")
-            widget.setStyleSheet("color: #ff8800; font-size: 16px;")
-            widget.setToolTip("Processing speech...")
-        elif status == "idle":
-            widget.setText("🎤")
-            widget.setStyleSheet("color: #666; font-size: 16px;")
-            widget.setToolTip("Speech recognition idle")
-        elif status == "disabled":
-            widget.setText("🚫")
-            widget.setStyleSheet("color: #ff0000; font-size: 16px;")
-            widget.setToolTip("Microphone disabled")
+        self._last_whisper_status = status
+        self._apply_status(self.whisper_status, status, WHISPER_STATES.get(status))
     
-    def _update_ai_status(self, status):
+    def _update_ai_status(self, status='idle'):
         """Update AI status indicator"""
-        if not hasattr(self.overlay_widget, 'ai_status'):
+        self._ai_idle_timer.stop()
+        if status == self._last_ai_status:
             return
-            
-        widget = self.overlay_widget.ai_status
-        
-        if status == "thinking":
-            widget.setText("🤔")
-            widget.setStyleSheet("color: #0088ff; font-size: 16px;")
-            widget.setToolTip("AI thinking...")
-        elif status == "responding":
-            widget.setText("💬")
-            widget.setStyleSheet("color: #00ff88; font-size: 16px;")
-            widget.setToolTip("AI responding...")
-        elif status == "idle":
-            widget.setText("🤖")
-            widget.setStyleSheet("color: #666; font-size: 16px;")
-            widget.setToolTip("AI idle")
-        elif status == "error":
-            widget.setText("⚠️")
-            widget.setStyleSheet("color: #ff0000; font-size: 16px;")
-            widget.setToolTip("AI error")
+        self._last_ai_status = status
+        self._apply_status(self.ai_status, status, AI_STATES.get(status))
+    
+    @staticmethod
+    def _apply_status(widget, status, text_and_tooltip):
+        """Restyle a status label and set its text/tooltip for a known status"""
+        set_style_state(widget, status)
+        if text_and_tooltip is not None:
+            text, tooltip = text_and_tooltip
+            widget.setText(text)
+            widget.setToolTip(tooltip)
     
-    def _add_timeline_entry(self, entry):
+    def _add_timeline_entry(self, entry=None, texts=None):
         """Add entry to timeline"""
-        from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel
-        
-        entry_widget = QFrame()
-        entry_widget.setStyleSheet("""
-            QFrame {
-                background-color: rgba(10, 10, 10, 180);
-                border: 1px solid rgba(0, 255, 0, 60);
-                border-radius: 5px;
-                margin: 2px;
-                padding: 8px;
-            }
-        """)
-        
-        entry_layout = QVBoxLayout(entry_widget)
-        
-        # Timestamp
-        timestamp_label = QLabel(entry.timestamp.strftime("[%H:%M:%S]"))
-        timestamp_label.setStyleSheet("color: #00ff00; font-size: 10px; font-family: 'Courier New', monospace;")
-        entry_layout.addWidget(timestamp_label)
-        
-        # Transcription
-        transcription_label = QLabel(f">>> {entry.transcription}")
-        transcription_label.setStyleSheet("color: #00ffff; font-weight: bold; font-family: 'Courier New', monospace;")
-        transcription_label.setWordWrap(True)
-        entry_layout.addWidget(transcription_label)
-        
-        # AI Response
-        response_label = QLabel(f"<<< {entry.ai_response}")
-        response_label.setStyleSheet("color: #00ff88; font-family: 'Courier New', monospace;")
-        response_label.setWordWrap(True)
-        entry_layout.addWidget(response_label)
-        
-        # Add to timeline
-        if hasattr(self.overlay_widget, 'timeline_layout'):
-            self.overlay_widget.timeline_layout.addWidget(entry_widget)
-            
-        # Auto-scroll to bottom
-        if hasattr(self.overlay_widget, 'timeline_scroll'):
-            QTimer.singleShot(100, lambda: self.overlay_widget.timeline_scroll.verticalScrollBar().setValue(
-                self.overlay_widget.timeline_scroll.verticalScrollBar().maximum()
-            ))
+        if entry:
+            self.overlay_widget.add_timeline_entry(entry, texts)
     
-    def _handle_claude_processing(self, text):
+    def _handle_claude_processing(self, text=''):
         """Handle Claude API processing"""
         print(f"UI Updater: _handle_claude_processing called with text: '{text}'")
         if not self.overlay_widget.claude_client:
@@ -175,54 +193,35 @@ class UIUpdater(QObject):
             return
             
         # Show AI status
-        self._update_ai_status("thinking")
-        if hasattr(self.overlay_widget, 'current_response'):
-            self.overlay_widget.current_response.setText("🤔 Processing...")
+        self.request_update("update_ai_status", status="thinking")
+        self.request_update("set_response", text="🤔 Processing...")
         
-        # Get context from recent conversation
-        context = ""
-        if len(self.overlay_widget.conversation_history) > 0:
-            recent_entries = self.overlay_widget.conversation_history[-2:]
-            context = " ".join([f"{entry.transcription}" for entry in recent_entries])
-            if len(context) > 200:
-                context = context[-200:]
+        # Context from recent conversation (rebuilt only when history changes)
+        context = self.overlay_widget._recent_context
         
-        # Async callback for AI response
+        # Async callback for AI response (Claude worker thread): the history and the
+        # timeline are only touched on the main thread, where ai_response_ready is delivered
         def on_ai_response(ai_response: str):
-            from .config import ConversationEntry
-            
-            try:
-                # Update AI status
+            # Only local strings are formatted here; the entry is built from the same timestamp
+            timestamp = datetime.now()
+            texts = format_lines(timestamp, text, ai_response)
+            self.overlay_widget.ai_response_ready.emit(text, ai_response, timestamp, texts)
+        
+        # Show streamed text as it arrives
+        partial_chunks = []
+        def on_ai_chunk(chunk: str):
+            if not partial_chunks:
                 self.request_update("update_ai_status", status="responding")
-                
-                # Create conversation entry
-                entry = ConversationEntry(datetime.now(), text, ai_response)
-                self.overlay_widget.conversation_history.append(entry)
-                
-                # Update UI
-                self.request_update("set_response", text=ai_response)
-                self.request_update("add_timeline_entry", entry=entry)
-                
-                # Keep only last 100 entries
-                if len(self.overlay_widget.conversation_history) > 100:
-                    self.overlay_widget.conversation_history = self.overlay_widget.conversation_history[-100:]
-                
-                # Set AI back to idle after a brief delay
-                def reset_ai_status():
-                    self.request_update("update_ai_status", status="idle")
-                QTimer.singleShot(2000, reset_ai_status)
-                    
-            except Exception as e:
-                print(f"Error handling AI response: {e}")
-                self.request_update("set_response", text=f"Error: {str(e)}")
-                self.request_update("update_ai_status", status="error")
+            partial_chunks.append(chunk)
+            self.request_update("set_response", text="".join(partial_chunks))
         
         # Get AI response asynchronously
-        self.overlay_widget.claude_client.get_response_async(
+        self.overlay_widget.claude_client.get_response_streaming(
             text, 
             context, 
             self.overlay_widget.settings.get('custom_prompt', ''),
             self.overlay_widget.settings.get('mode', 'default'),
-            callback=on_ai_response,
+            on_chunk=on_ai_chunk,
+            on_done=on_ai_response,
             settings=self.overlay_widget.settings
         )
\ No newline at end of file
@@ -14,12 +14,15 @@ with open(os.path.join(this_directory, 'README.md'), encoding='utf-8') as f:
 # Core dependencies that are always required
 install_requires = [
     'PyQt6>=6.5.0',
-    'anthropic>=0.7.0',
+    'anthropic>=0.26.0',
     'sounddevice>=0.4.6',
     'speech-recognition>=3.10.0',
     'numpy>=1.24.0',
     'python-dotenv>=1.0.0',
     'pyaudio>=0.2.11',  # For speech_recognition
+    'diskcache>=5.6.0',
+    'orjson>=3.9.0',
+    'msgpack>=1.0.0',
 ]
 
 # Optional dependencies for enhanced features
@@ -78,7 +81,7 @@ setup(
     },
     include_package_data=True,
     package_data={
-        'sai': ['*.md', '*.txt'],
+        'sai': ['*.md', '*.txt', '*.png'],
     },
     keywords='ai assistant voice overlay claude whisper speech-to-text',
     project_urls={
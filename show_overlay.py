@@ -4,14 +4,23 @@ Simple script to show/unhide the overlay if it's running but not visible
 """
 
 import psutil
+import re
 import sys
 import os
 
+# Apps whose presence makes the overlay auto-hide, matched anywhere in a process name
+EXCLUDED_PROCESSES = ('zoom', 'skype', 'teams', 'discord', 'slack', 'chrome', 'firefox', 'meet', 'webex')
+EXCLUDED_RE = re.compile('|'.join(map(re.escape, EXCLUDED_PROCESSES)))
+
 def find_overlay_process():
     """Find the overlay assistant process"""
-    for proc in psutil.process_iter(['pid', 'cmdline']):
+    # Only Python processes can be the overlay; their command lines are read on demand
+    for proc in psutil.process_iter(['pid', 'name']):
         try:
-            if proc.info['cmdline'] and 'overlay_assistant.py' in ' '.join(proc.info['cmdline']):
+            name = proc.info['name']
+            if not name or 'python' not in name.lower():
+                continue
+            if any('overlay_assistant.py' in arg for arg in proc.cmdline()):
                 return proc
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
@@ -30,16 +39,13 @@ def main():
         
         # Check what processes might be triggering auto-hide
         print("\nChecking for processes that might trigger auto-hide:")
-        excluded_procs = ['zoom', 'skype', 'teams', 'discord', 'slack', 'chrome', 'firefox', 'meet', 'webex']
         found_excluded = []
         
         for p in psutil.process_iter(['name']):
             try:
-                proc_name = p.info['name'].lower()
-                for excluded in excluded_procs:
-                    if excluded in proc_name:
-                        found_excluded.append(proc_name)
-                        break
+                proc_name = (p.info['name'] or '').lower()
+                if EXCLUDED_RE.search(proc_name):
+                    found_excluded.append(proc_name)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
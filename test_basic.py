@@ -5,7 +5,9 @@ Basic test script to verify core functionality without UI
 
 import sys
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
+import numpy as np
 import sounddevice as sd
 
 # Load environment variables
@@ -23,31 +25,39 @@ def test_microphone():
         print("Testing audio recording...")
         duration = 1.0
         sample_rate = 16000
-        audio_data = sd.rec(
-            int(duration * sample_rate),
+        frames = int(duration * sample_rate)
+        audio_data = np.empty((frames, 1), dtype=np.float32)
+        # One blocking read of the whole sample into a preallocated buffer
+        with sd.InputStream(
             samplerate=sample_rate,
             channels=1,
-            dtype='float32'
-        )
-        sd.wait()
+            dtype='float32',
+            blocksize=frames,
+            latency='low'
+        ) as stream:
+            audio_data[:], _ = stream.read(frames)
         print(f"Recorded {len(audio_data)} samples successfully")
         return True
     except Exception as e:
         print(f"Microphone test failed: {e}")
         return False
 
+@lru_cache(maxsize=1)
+def _claude_client(api_key):
+    """Shared Anthropic client, so repeated checks reuse its connection pool"""
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
 def test_claude_api():
     """Test Claude API connection"""
     print("Testing Claude API...")
     try:
-        import anthropic
-        
         api_key = os.getenv('ANTHROPIC_API_KEY')
         if not api_key:
             print("No ANTHROPIC_API_KEY found in environment")
             return False
         
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _claude_client(api_key)
         
         # Test with a simple message
         message = client.messages.create(
@@ -55,7 +65,8 @@ def test_claude_api():
             max_tokens=50,
             messages=[
                 {"role": "user", "content": "Say 'API test successful' if you can read this"}
-            ]
+            ],
+            timeout=10
         )
         
         response = message.content[0].text